@@ -1,104 +1,162 @@
 #!/usr/bin/env python3
 """Analyze recent inbox documents to understand extraction needs."""
 
-import json
-import urllib.request
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-token = os.environ.get("PAPERLESS_API_TOKEN")
-headers = {"Authorization": f"Token {token}", "Host": "localhost"}
+import httpx
 
-def get_doc(doc_id):
-    req = urllib.request.Request(
-        f"http://127.0.0.1:8000/api/documents/{doc_id}/",
-        headers=headers
-    )
-    with urllib.request.urlopen(req) as resp:
-        return json.loads(resp.read().decode())
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # google-re2: same API as `re`, but a linear-time automaton with no backtracking
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Patterns stay within the RE2 subset (no backreferences or lookaround), so they
+# compile unchanged under either engine.
+# Within a family the patterns are tried in order and the first one that
+# matches wins, even if a later pattern matches earlier in the text.
+# Adjacent tokens use disjoint character classes and whitespace runs are capped,
+# so a long noisy OCR line cannot make the engine backtrack quadratically.
+# Patterns are case-sensitive and lowercase: they run on the lowercased content,
+# so case folding happens once per document instead of inside every match.
+# Invoice number patterns
+_INV_PATTERNS = (
+    _re.compile(r'fatura\s{1,3}(?:n[.º°]?\s{0,3})?([a-z0-9.]+(?:[-/][a-z0-9.]+)+)'),
+    _re.compile(r'factura\s{1,3}n[.º°]?\s{0,3}([a-z0-9./]+(?:[ \t][a-z0-9./]+)*)'),
+    _re.compile(r'ft\s{1,3}([a-z0-9./]+)'),
+)
+
+# Total amount patterns ("total (eur)" is covered by the first)
+_TOTAL_PATTERNS = (
+    _re.compile(r'total[:\s]{1,3}(?:\(\s{0,3}eur\s{0,3}\)|eur)?\s{0,3}([0-9][0-9.,]*)'),
+    _re.compile(r'total\s{1,3}documento[:\s]{1,3}([0-9][0-9.,]*)'),
+)
+
+# NIF pattern (the n.i.f. forms already cover a plain "nif")
+_NIF_RE = _re.compile(r'(?:n\.?i\.?[fp]\.?|contribuinte)[:\s]{0,3}(\d{9})')
+
+# Lowercase tokens every match of the corresponding family must contain;
+# a cheap substring check skips the regex pass when none are present.
+_INV_TOKENS = ('fatura', 'factura', 'ft')
+_NIF_TOKENS = (
+    'contribuinte', 'nif', 'nip', 'n.if', 'n.ip', 'ni.f', 'ni.p', 'n.i.f', 'n.i.p',
+)
+
+# Date patterns
+_DATE_PATTERNS = (
+    _re.compile(r'data[:\s]{1,3}(\d{4}[-/]\d{2}[-/]\d{2})'),
+    _re.compile(r'(\d{4}[-/]\d{2}[-/]\d{2})'),
+)
+
+def get_doc(client, doc_id):
+    # Only the OCR text is needed here; metadata comes from the listing
+    resp = client.get(f"/documents/{doc_id}/", params={"fields": "id,content"})
+    resp.raise_for_status()
+    return json_loads(resp.content)
 
 def extract_values(content):
     """Try to extract common values from OCR content."""
     results = {}
 
-    # Invoice number patterns
-    inv_patterns = [
-        r'Fatura\s+(?:n[.º°]?\s*)?([A-Z0-9./]+[-/][A-Z0-9./]+)',
-        r'Factura\s+n[.º°]?\s*([A-Z0-9./\s]+)',
-        r'FT\s+([A-Z0-9./]+)',
-    ]
-    for pat in inv_patterns:
-        m = re.search(pat, content, re.IGNORECASE)
-        if m:
-            results['invoice_number'] = m.group(1).strip()
-            break
+    # str.lower() keeps Portuguese accented letters as single characters, so
+    # match offsets in `lc` line up with `content`. A few characters (e.g. 'İ')
+    # lower to two code points; fold those documents per character instead.
+    lc = content.lower()
+    if len(lc) != len(content):
+        lc = ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in content)
 
-    # Total amount patterns
-    total_patterns = [
-        r'Total[:\s]+(?:\(?\s*EUR\s*\)?)?\s*([0-9.,]+)',
-        r'Total\s+\(\s*EUR\s*\)\s*([0-9.,]+)',
-        r'Total\s+Documento[:\s]+([0-9.,]+)',
-    ]
-    for pat in total_patterns:
-        m = re.search(pat, content, re.IGNORECASE)
-        if m:
-            results['total'] = m.group(1).strip()
-            break
+    if any(tok in lc for tok in _INV_TOKENS):
+        for pat in _INV_PATTERNS:
+            m = pat.search(lc)
+            if m:
+                # Slice the original text so the invoice number keeps its case
+                results['invoice_number'] = content[m.start(1):m.end(1)].strip()
+                break
 
-    # NIF patterns
-    nif_patterns = [
-        r'(?:N\.?I\.?[FP]\.?|Contribuinte)[:\s]*(\d{9})',
-        r'NIF[:\s]*(\d{9})',
-    ]
-    for pat in nif_patterns:
-        matches = re.findall(pat, content, re.IGNORECASE)
+    if 'total' in lc:
+        for pat in _TOTAL_PATTERNS:
+            m = pat.search(lc)
+            if m:
+                results['total'] = m.group(1).strip()
+                break
+
+    if any(tok in lc for tok in _NIF_TOKENS):
+        matches = _NIF_RE.findall(lc)
         if matches:
             results['nif_found'] = matches[:2]  # First 2 NIFs
-            break
 
-    # Date patterns
-    date_patterns = [
-        r'Data[:\s]+(\d{4}[-/]\d{2}[-/]\d{2})',
-        r'(\d{4}[-/]\d{2}[-/]\d{2})',
-    ]
-    for pat in date_patterns:
-        m = re.search(pat, content)
+    for pat in _DATE_PATTERNS:
+        m = pat.search(lc)
         if m:
             results['date'] = m.group(1)
             break
 
     return results
 
-# Get recent documents
-req = urllib.request.Request(
-    "http://127.0.0.1:8000/api/documents/?page_size=15&ordering=-added",
-    headers=headers
-)
-with urllib.request.urlopen(req) as resp:
-    data = json.loads(resp.read().decode())
-
-print(f"Analyzing {len(data['results'])} recent documents...\n")
-
-for doc in data['results'][:15]:
-    doc_id = doc['id']
-    full_doc = get_doc(doc_id)
-    content = full_doc.get('content', '')
-
-    print("=" * 70)
-    print(f"ID {doc_id}: {doc['title'][:55]}")
-    print(f"  File: {doc.get('original_file_name', '')[:55]}")
-    print(f"  Custom fields filled: {len([cf for cf in doc.get('custom_fields', []) if cf.get('value')])}")
-
-    # Extract values
-    extracted = extract_values(content)
-    if extracted:
-        print(f"  EXTRACTED:")
-        for k, v in extracted.items():
-            print(f"    {k}: {v}")
-    else:
-        print(f"  EXTRACTED: (nothing matched)")
-
-    # Show first few lines of content
-    lines = [l.strip() for l in content.split('\n') if l.strip()][:5]
-    print(f"  Content preview: {' | '.join(lines)[:100]}...")
-    print()
+def main():
+    """Print the values found in the most recent documents."""
+    token = os.environ.get("PAPERLESS_API_TOKEN")
+    headers = {"Authorization": f"Token {token}", "Host": "localhost"}
+
+    # One keep-alive connection pool shared by all requests (httpx.Client is thread-safe)
+    client = httpx.Client(
+        base_url="http://127.0.0.1:8000/api",
+        headers=headers,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    )
+
+    # Get recent documents (metadata only - content is fetched per document)
+    resp = client.get(
+        "/documents/",
+        params={
+            "page_size": 15,
+            "ordering": "-added",
+            "fields": "id,title,original_file_name,custom_fields",
+        },
+    )
+    resp.raise_for_status()
+    data = json_loads(resp.content)
+
+    print(f"Analyzing {len(data['results'])} recent documents...\n")
+
+    docs = data['results'][:15]
+
+    # Fetch document contents concurrently - each fetch is one network round-trip
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        full_docs = list(executor.map(partial(get_doc, client), [d['id'] for d in docs]))
+
+    for doc, full_doc in zip(docs, full_docs):
+        doc_id = doc['id']
+        content = full_doc.get('content', '')
+
+        print("=" * 70)
+        print(f"ID {doc_id}: {doc['title'][:55]}")
+        print(f"  File: {doc.get('original_file_name', '')[:55]}")
+        print(f"  Custom fields filled: {len([cf for cf in doc.get('custom_fields', []) if cf.get('value')])}")
+
+        # Extract values
+        extracted = extract_values(content)
+        if extracted:
+            print(f"  EXTRACTED:")
+            for k, v in extracted.items():
+                print(f"    {k}: {v}")
+        else:
+            print(f"  EXTRACTED: (nothing matched)")
+
+        # Show first few lines of content
+        lines = [l.strip() for l in content.split('\n') if l.strip()][:5]
+        print(f"  Content preview: {' | '.join(lines)[:100]}...")
+        print()
+
+    client.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """Claude API client using official Anthropic SDK."""
 
+import copy
+import hashlib
+import importlib.util
 import json
-import re
 import time
+from collections.abc import Callable
 from typing import Any
 
 import anthropic
+import httpx
 import structlog
 
 from papersqueeze.config.schema import AnthropicConfig, Template, TemplatesConfig
@@ -21,13 +25,143 @@ from papersqueeze.models.extraction import (
     ExtractionResult,
     FieldType,
 )
+from papersqueeze.utils.cache import LRUCache
+from papersqueeze.utils.patterns import extract_missing_fields, select_relevant_snippets
+
+_json_loads: Callable[[bytes | str], Any]
+try:
+    # Optional C-accelerated parser; raises a json.JSONDecodeError subclass
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = structlog.get_logger()
 
-# Regex to extract JSON from markdown code blocks
-JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```", re.IGNORECASE)
-# Fallback: find JSON object in response
-JSON_OBJECT_PATTERN = re.compile(r"\{[\s\S]*\}")
+# HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# SDK clients shared by every ClaudeClient with the same settings, so they
+# share one connection pool instead of each opening their own
+_CLIENT_CACHE: dict[tuple[str, int, int], anthropic.Anthropic] = {}
+
+
+def _get_shared_client(api_key: str, timeout: int, max_retries: int) -> anthropic.Anthropic:
+    """Get or create the SDK client for a given (api_key, timeout, max_retries)."""
+    key = (api_key, timeout, max_retries)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = anthropic.Anthropic(
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            http_client=anthropic.DefaultHttpxClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            ),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+# Confidence assigned to values read by the local patterns; below the default
+# auto-apply threshold, so they are queued for review rather than filled in
+LOCAL_EXTRACTION_CONFIDENCE = 0.6
+
+# classify_and_extract results kept per client
+_RESULT_CACHE_SIZE = 256
+
+# Template field type -> extracted field type (anything else is a string)
+_FIELD_TYPE_MAP = {
+    "date": FieldType.DATE,
+    "amount": FieldType.AMOUNT,
+    "number": FieldType.NUMBER,
+    "integer": FieldType.INTEGER,
+}
+
+# Shared decoder: raw_decode parses the first complete JSON value at an offset
+# and ignores whatever text follows it
+_JSON_DECODER = json.JSONDecoder()
+
+# User message templates (filled with str.format per document)
+_CLASSIFY_TEMPLATE = """Available templates:
+{descriptions}
+
+Document content (truncated):
+{content}
+
+Classify this document and return JSON with:
+- template_id: The ID of the best matching template
+- confidence: Your confidence (0.0 to 1.0)
+- reasoning: Brief explanation (optional)
+"""
+
+_EXTRACT_TEMPLATE = """Document content:
+{content}
+
+Extract the requested fields and return JSON with:
+- fields: Object mapping field names to extracted values
+- confidence: Object mapping field names to confidence scores (0.0 to 1.0)
+- notes: Any extraction notes or issues (optional)
+
+Example format:
+{{
+  "fields": {{"issue_date": "2025-01-15", "total_gross": "123.45"}},
+  "confidence": {{"issue_date": 0.95, "total_gross": 0.88}},
+  "notes": "Amount was partially obscured"
+}}
+"""
+
+_COMBINED_TEMPLATE = """Document content:
+{content}
+
+Classify this document against the available templates, then extract the
+fields of the selected template. Return JSON with:
+- template_id: The ID of the best matching template
+- template_confidence: Your confidence in the template choice (0.0 to 1.0)
+- reasoning: Brief explanation of the template choice (optional)
+- fields: Object mapping field names to extracted values
+- confidence: Object mapping field names to confidence scores (0.0 to 1.0)
+- notes: Any extraction notes or issues (optional)
+
+Example format:
+{{
+  "template_id": "utilities_energy",
+  "template_confidence": 0.93,
+  "fields": {{"issue_date": "2025-01-15", "total_gross": "123.45"}},
+  "confidence": {{"issue_date": 0.95, "total_gross": 0.88}},
+  "notes": "Amount was partially obscured"
+}}
+"""
+
+
+def _format_field_descriptions(template: Template) -> str:
+    """Format a template's extraction fields as a bullet list for prompts."""
+    return "\n".join(
+        f"- {f.name} ({f.type}): {f.description or 'No description'}"
+        + (" [REQUIRED]" if f.required else "")
+        for f in template.extraction.fields
+    )
+
+
+def _truncate(content: str, limit: int) -> str:
+    """Cut content to at most limit characters."""
+    return content if len(content) <= limit else content[:limit]
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the body of the first markdown code block, or text unchanged."""
+    _, fence, rest = text.partition("```")
+    if not fence:
+        return text
+
+    body, closing, _ = rest.partition("```")
+    if not closing:
+        return text
+
+    # Drop an optional language tag (```json)
+    if body[:4].lower() == "json":
+        body = body[4:]
+    return body
 
 
 def _extract_json_from_response(text: str) -> dict[str, Any]:
@@ -42,27 +176,59 @@ def _extract_json_from_response(text: str) -> dict[str, Any]:
     Raises:
         ValueError: If no valid JSON found.
     """
-    # Try markdown code block first
-    match = JSON_BLOCK_PATTERN.search(text)
-    if match:
+    # Fast path: bare JSON (the usual reply) needs no code-block search
+    stripped = text.strip()
+    if stripped.startswith("{"):
         try:
-            return json.loads(match.group(1).strip())
+            if stripped.endswith("}"):
+                data = _json_loads(stripped)
+            else:
+                data, _ = _JSON_DECODER.raw_decode(stripped)
         except json.JSONDecodeError:
             pass
+        else:
+            if isinstance(data, dict):
+                return data
+
+    # Try markdown code block first, then the whole response
+    block = _strip_code_fence(text)
+    candidates = (block, text) if block is not text else (text,)
+
+    # Decode at each '{' in turn, so a stray brace in leading prose does not
+    # hide the object that follows it
+    for candidate in candidates:
+        start = candidate.find("{")
+        while start >= 0:
+            try:
+                data, _ = _JSON_DECODER.raw_decode(candidate, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(data, dict):
+                    return data
+            start = candidate.find("{", start + 1)
+
+    raise ValueError("Could not extract JSON from response: no valid JSON object found")
 
-    # Try to find raw JSON object
-    match = JSON_OBJECT_PATTERN.search(text)
-    if match:
-        try:
-            return json.loads(match.group(0))
-        except json.JSONDecodeError:
-            pass
 
-    # Try parsing the whole thing
-    try:
-        return json.loads(text.strip())
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Could not extract JSON from response: {e}") from e
+def _fill_missing_fields(data: dict[str, Any], content: str, template: Template) -> dict[str, Any]:
+    """Fill the fields an extraction response left empty from the local patterns.
+
+    Locally matched values get LOCAL_EXTRACTION_CONFIDENCE; fields the model
+    filled are kept as they are.
+    """
+    fields = data.get("fields") or {}
+    local_values = extract_missing_fields(content, fields, template.field_names)
+    if not local_values:
+        return data
+    return {
+        **data,
+        "fields": {**fields, **local_values},
+        "confidence": {
+            **(data.get("confidence") or {}),
+            **dict.fromkeys(local_values, LOCAL_EXTRACTION_CONFIDENCE),
+        },
+    }
 
 
 class ClaudeClient:
@@ -75,16 +241,30 @@ class ClaudeClient:
             config: Anthropic API configuration.
         """
         self.config = config
-        self.client = anthropic.Anthropic(
+        self.client = _get_shared_client(
             api_key=config.api_key,
             timeout=config.timeout_seconds,
             max_retries=config.max_retries,
         )
 
+        # Assembled prompt parts, reused across documents
+        self._system_prompt_cache: dict[tuple[str, str], str] = {}
+        self._template_descriptions: tuple[TemplatesConfig, str] | None = None
+        self._combined_prompt: tuple[TemplatesConfig, list[dict[str, Any]], bytes] | None = None
+
+        # classify_and_extract results keyed by content, template catalog and model
+        self._result_cache: LRUCache[bytes, tuple[ClassificationResult, ExtractionResult]] = (
+            LRUCache(_RESULT_CACHE_SIZE)
+        )
+
+    def clear_cache(self) -> None:
+        """Drop cached classify_and_extract results."""
+        self._result_cache.clear()
+
     def _call_claude(
         self,
         model: str,
-        system_prompt: str,
+        system_prompt: str | list[dict[str, Any]],
         user_message: str,
         max_tokens: int | None = None,
     ) -> tuple[str, float]:
@@ -92,7 +272,8 @@ class ClaudeClient:
 
         Args:
             model: Model ID to use.
-            system_prompt: System prompt for context.
+            system_prompt: System prompt for context, either plain text or a
+                list of content blocks (used for prompt caching).
             user_message: User message (document content).
             max_tokens: Override default max tokens.
 
@@ -151,24 +332,22 @@ class ClaudeClient:
         """
         log = logger.bind(operation="classify")
 
-        # Build the classification prompt
-        template_descriptions = "\n".join(
-            f"- {t.id}: {t.description}"
-            for t in templates_config.templates
-        )
+        # Build the classification prompt; the template list is built once
+        # per templates configuration
+        if self._template_descriptions and self._template_descriptions[0] is templates_config:
+            template_descriptions = self._template_descriptions[1]
+        else:
+            template_descriptions = "\n".join(
+                f"- {t.id}: {t.description}"
+                for t in templates_config.templates
+            )
+            self._template_descriptions = (templates_config, template_descriptions)
 
         system_prompt = templates_config.base_prompts.gatekeeper
-        user_message = f"""Available templates:
-{template_descriptions}
-
-Document content (truncated):
-{content[:self.config.max_tokens * 3]}
-
-Classify this document and return JSON with:
-- template_id: The ID of the best matching template
-- confidence: Your confidence (0.0 to 1.0)
-- reasoning: Brief explanation (optional)
-"""
+        user_message = _CLASSIFY_TEMPLATE.format(
+            descriptions=template_descriptions,
+            content=_truncate(content, self.config.max_tokens * 3),
+        )
 
         try:
             response_text, elapsed_ms = self._call_claude(
@@ -197,12 +376,11 @@ Classify this document and return JSON with:
                 )
 
             # Validate template exists
-            valid_ids = templates_config.get_template_ids()
-            if template_id not in valid_ids:
+            if templates_config.get_template_by_id(template_id) is None:
                 log.warning(
                     "Unknown template ID, using fallback",
                     returned_id=template_id,
-                    valid_ids=valid_ids,
+                    valid_ids=templates_config.get_template_ids(),
                 )
                 template_id = "fallback_general"
 
@@ -252,14 +430,11 @@ Classify this document and return JSON with:
         """
         log = logger.bind(operation="extract", template_id=template.id)
 
-        # Build field list for prompt
-        field_descriptions = "\n".join(
-            f"- {f.name} ({f.type}): {f.description or 'No description'}"
-            + (" [REQUIRED]" if f.required else "")
-            for f in template.extraction.fields
-        )
-
-        system_prompt = f"""{base_specialist_prompt}
+        # Build the system prompt once per (template, base prompt)
+        cache_key = (template.id, base_specialist_prompt)
+        system_prompt = self._system_prompt_cache.get(cache_key)
+        if system_prompt is None:
+            system_prompt = f"""{base_specialist_prompt}
 
 Template: {template.id} - {template.description}
 
@@ -267,24 +442,13 @@ Extraction Rules:
 {template.extraction.rules}
 
 Fields to extract:
-{field_descriptions}
+{_format_field_descriptions(template)}
 """
+            self._system_prompt_cache[cache_key] = system_prompt
 
-        user_message = f"""Document content:
-{content[:self.config.max_tokens * 10]}
-
-Extract the requested fields and return JSON with:
-- fields: Object mapping field names to extracted values
-- confidence: Object mapping field names to confidence scores (0.0 to 1.0)
-- notes: Any extraction notes or issues (optional)
-
-Example format:
-{{
-  "fields": {{"issue_date": "2025-01-15", "total_gross": "123.45"}},
-  "confidence": {{"issue_date": 0.95, "total_gross": 0.88}},
-  "notes": "Amount was partially obscured"
-}}
-"""
+        user_message = _EXTRACT_TEMPLATE.format(
+            content=select_relevant_snippets(content, self.config.max_tokens * 10),
+        )
 
         try:
             response_text, elapsed_ms = self._call_claude(
@@ -305,46 +469,11 @@ Example format:
                     raw_response=response_text,
                 ) from e
 
-            # Build extracted fields
-            fields: dict[str, ExtractedField] = {}
-            raw_fields = data.get("fields", {})
-            confidences = data.get("confidence", {})
-
-            for field_def in template.extraction.fields:
-                field_name = field_def.name
-                raw_value = raw_fields.get(field_name)
-
-                if raw_value is not None:
-                    raw_value = str(raw_value) if raw_value else None
-
-                confidence = float(confidences.get(field_name, 0.5))
-
-                # Determine field type
-                field_type = FieldType.STRING
-                if field_def.type == "date":
-                    field_type = FieldType.DATE
-                elif field_def.type == "amount":
-                    field_type = FieldType.AMOUNT
-                elif field_def.type == "number":
-                    field_type = FieldType.NUMBER
-                elif field_def.type == "integer":
-                    field_type = FieldType.INTEGER
-
-                fields[field_name] = ExtractedField(
-                    name=field_name,
-                    raw_value=raw_value,
-                    normalized_value=None,  # Will be normalized later
-                    confidence=confidence,
-                    field_type=field_type,
-                )
-
-            result = ExtractionResult(
-                template_id=template.id,
+            result = self._build_extraction_result(
+                template=template,
+                data=_fill_missing_fields(data, content, template),
                 template_confidence=0.9,  # Already classified
-                fields=fields,
-                raw_response=data,
-                processing_time_ms=elapsed_ms,
-                extraction_notes=data.get("notes"),
+                elapsed_ms=elapsed_ms,
             )
 
             log.info(
@@ -367,6 +496,102 @@ Example format:
                 template_id=template.id,
             ) from e
 
+    def _build_extraction_result(
+        self,
+        template: Template,
+        data: dict[str, Any],
+        template_confidence: float,
+        elapsed_ms: float,
+    ) -> ExtractionResult:
+        """Build an ExtractionResult from a parsed extraction response.
+
+        Args:
+            template: Template whose fields were extracted.
+            data: Parsed JSON response with 'fields', 'confidence' and 'notes'.
+            template_confidence: Confidence that the template is correct.
+            elapsed_ms: API call time in milliseconds.
+
+        Returns:
+            ExtractionResult with one ExtractedField per template field.
+        """
+        fields: dict[str, ExtractedField] = {}
+        raw_fields = data.get("fields") or {}
+        confidences = data.get("confidence") or {}
+
+        for field_def in template.extraction.fields:
+            field_name = field_def.name
+            raw_value = raw_fields.get(field_name)
+
+            if raw_value is not None:
+                raw_value = str(raw_value) if raw_value else None
+
+            confidence = float(confidences.get(field_name, 0.5))
+
+            field_type = _FIELD_TYPE_MAP.get(field_def.type, FieldType.STRING)
+
+            fields[field_name] = ExtractedField(
+                name=field_name,
+                raw_value=raw_value,
+                normalized_value=None,  # Will be normalized later
+                confidence=confidence,
+                field_type=field_type,
+            )
+
+        return ExtractionResult(
+            template_id=template.id,
+            template_confidence=template_confidence,
+            fields=fields,
+            raw_response=data,
+            processing_time_ms=elapsed_ms,
+            extraction_notes=data.get("notes"),
+        )
+
+    def _build_combined_system_prompt(
+        self,
+        templates_config: TemplatesConfig,
+    ) -> tuple[list[dict[str, Any]], bytes]:
+        """Build the system prompt for single-call classification + extraction.
+
+        The specialist prompt and the full template catalog are identical for
+        every document, so they are sent as a cacheable prefix. The cache
+        breakpoint on the last block covers both blocks. The blocks are built
+        once and reused while the same templates configuration is passed in.
+
+        Args:
+            templates_config: Templates configuration.
+
+        Returns:
+            Tuple of (system content blocks, digest of the prompt text).
+        """
+        if self._combined_prompt and self._combined_prompt[0] is templates_config:
+            return self._combined_prompt[1], self._combined_prompt[2]
+
+        catalog = "\n\n".join(
+            f"""Template: {t.id} - {t.description}
+
+Extraction Rules:
+{t.extraction.rules}
+
+Fields to extract:
+{_format_field_descriptions(t)}"""
+            for t in templates_config.templates
+            if t.extraction
+        )
+
+        blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": templates_config.base_prompts.specialist},
+            {
+                "type": "text",
+                "text": f"Available templates:\n\n{catalog}",
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+        digest = hashlib.blake2b(
+            "\0".join(b["text"] for b in blocks).encode(), digest_size=16
+        ).digest()
+        self._combined_prompt = (templates_config, blocks, digest)
+        return blocks, digest
+
     def classify_and_extract(
         self,
         content: str,
@@ -374,7 +599,13 @@ Example format:
     ) -> tuple[ClassificationResult, ExtractionResult]:
         """Classify a document and extract metadata in one call.
 
-        Convenience method that chains classification and extraction.
+        Sends a single request to the specialist model with every template's
+        extraction rules in a cached system prompt; the model picks the
+        template and extracts its fields in the same response.
+
+        Results are cached per client, keyed by the content, the template
+        catalog and the model, so reprocessing a document makes no API call.
+        Cache hits return copies; use clear_cache() to force a new request.
 
         Args:
             content: Document OCR text content.
@@ -387,28 +618,89 @@ Example format:
             ClassificationError: If classification fails.
             ExtractionError: If extraction fails.
         """
-        # Step 1: Classify
-        classification = self.classify_document(content, templates_config)
-
-        # Step 2: Get template
-        template = templates_config.get_template_by_id(classification.template_id)
-        if not template:
-            # Use fallback
-            template = templates_config.get_template_by_id("fallback_general")
-            if not template:
+        log = logger.bind(operation="classify_and_extract")
+
+        model = self.config.specialist_model.value
+        system_prompt, prompt_digest = self._build_combined_system_prompt(templates_config)
+        cache_key = (
+            hashlib.blake2b(content.encode(), digest_size=16).digest()
+            + prompt_digest
+            + model.encode()
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            log.debug("Using cached result", template_id=cached[0].template_id)
+            # Callers normalize extracted fields in place, so hand out copies
+            return copy.deepcopy(cached)
+
+        user_message = _COMBINED_TEMPLATE.format(
+            content=select_relevant_snippets(content, self.config.max_tokens * 10),
+        )
+
+        response_text, elapsed_ms = self._call_claude(
+            model=model,
+            system_prompt=system_prompt,
+            user_message=user_message,
+        )
+
+        log.debug("Combined response", response=response_text[:500])
+
+        # Parse response
+        try:
+            data = _extract_json_from_response(response_text)
+        except ValueError as e:
+            raise ClassificationError(
+                f"Failed to parse classification response: {e}",
+                raw_response=response_text,
+            ) from e
+
+        template_id = data.get("template_id") or data.get("selected_id")
+        if not template_id:
+            raise ClassificationError(
+                "No template_id in classification response",
+                raw_response=response_text,
+            )
+
+        # Validate template exists and can be extracted
+        template = templates_config.get_template_by_id(template_id)
+        if not template or not template.extraction:
+            log.warning("Unknown template ID, using fallback", returned_id=template_id)
+            template_id = "fallback_general"
+            template = templates_config.get_template_by_id(template_id)
+            if not template or not template.extraction:
                 raise ExtractionError(
-                    f"Template not found and no fallback: {classification.template_id}",
-                    template_id=classification.template_id,
+                    f"Template not found and no fallback: {data.get('template_id')}",
+                    template_id=data.get("template_id"),
+                    raw_response=response_text,
                 )
 
-        # Step 3: Extract
-        extraction = self.extract_metadata(
-            content=content,
-            template=template,
-            base_specialist_prompt=templates_config.base_prompts.specialist,
-        )
+        try:
+            classification = ClassificationResult(
+                template_id=template_id,
+                confidence=float(data.get("template_confidence", 0.5)),
+                reasoning=data.get("reasoning"),
+                processing_time_ms=elapsed_ms,
+                raw_response=data,
+            )
+            extraction = self._build_extraction_result(
+                template=template,
+                data=_fill_missing_fields(data, content, template),
+                template_confidence=classification.confidence,
+                elapsed_ms=elapsed_ms,
+            )
+        except Exception as e:
+            raise ExtractionError(
+                f"Extraction failed: {e}",
+                template_id=template_id,
+            ) from e
 
-        # Update extraction with classification confidence
-        extraction.template_confidence = classification.confidence
+        log.info(
+            "Document classified and extracted",
+            template_id=template_id,
+            confidence=classification.confidence,
+            fields_extracted=extraction.extracted_count,
+            elapsed_ms=round(elapsed_ms, 1),
+        )
 
+        self._result_cache[cache_key] = copy.deepcopy((classification, extraction))
         return classification, extraction
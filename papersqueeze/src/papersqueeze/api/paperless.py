@@ -1,9 +1,13 @@
 """Paperless-ngx API client (synchronous)."""
 
 import hashlib
+import importlib.util
 import logging
+import time
+from collections.abc import Callable, Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
 
@@ -14,10 +18,106 @@ from papersqueeze.exceptions import (
     PaperlessNotFoundError,
 )
 
+_json_loads: Callable[[bytes | str], Any]
+try:
+    # Optional C-accelerated parser; document payloads carry the full OCR text
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by the requests of one client
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60,
+)
+
+# Retries of failed connection attempts (not of HTTP error responses)
+_CONNECT_RETRIES = 2
+
+# Concurrent page requests while preloading metadata
+_PRELOAD_WORKERS = 8
+
+# Requested list page size; most installs fit in one page per endpoint. If the
+# server caps it lower, the real size is read from the first page.
+_PAGE_SIZE = 1000
+
+# Document fields needed for a snapshot without the OCR content
+_METADATA_FIELDS = ",".join([
+    "id",
+    "title",
+    "original_file_name",
+    "correspondent",
+    "document_type",
+    "tags",
+    "custom_fields",
+    "created",
+    "added",
+    "modified",
+    "storage_path",
+    "archive_serial_number",
+])
+
+K = TypeVar("K")
+V = TypeVar("V")
+M = TypeVar("M")
+
+
+class _TTLCache(MutableMapping[K, V]):
+    """Dict whose entries expire a fixed time after they were stored.
+
+    Expired entries are dropped when they are next looked up. A ttl of 0
+    keeps entries forever.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl = ttl_seconds
+        self._data: dict[K, tuple[V, float]] = {}
+
+    def _expired(self, inserted_at: float) -> bool:
+        return bool(self._ttl) and time.monotonic() - inserted_at >= self._ttl
+
+    def __getitem__(self, key: K) -> V:
+        value, inserted_at = self._data[key]
+        if self._expired(inserted_at):
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: V | None = None) -> V | None:  # type: ignore[override]
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if self._expired(entry[1]):
+            del self._data[key]
+            return default
+        return entry[0]
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = (value, time.monotonic())
+
+    def __delitem__(self, key: K) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter([k for k, (_, t) in self._data.items() if not self._expired(t)])
+
+    def __len__(self) -> int:
+        return sum(1 for _, t in self._data.values() if not self._expired(t))
 
-@dataclass
+    def clear(self) -> None:
+        self._data.clear()
+
+
+@dataclass(slots=True, frozen=True)
 class Tag:
     """Paperless tag."""
     id: int
@@ -26,7 +126,7 @@ class Tag:
     color: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Correspondent:
     """Paperless correspondent."""
     id: int
@@ -34,7 +134,7 @@ class Correspondent:
     slug: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentType:
     """Paperless document type."""
     id: int
@@ -42,7 +142,7 @@ class DocumentType:
     slug: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CustomField:
     """Paperless custom field definition."""
     id: int
@@ -50,7 +150,7 @@ class CustomField:
     data_type: str = "string"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CustomFieldValue:
     """Custom field value on a document."""
     field_id: int
@@ -58,12 +158,13 @@ class CustomFieldValue:
     value: Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentSnapshot:
     """Immutable snapshot of document state.
 
     Used for the state pipeline: capture state before processing,
-    compare after to generate diffs.
+    compare after to generate diffs. Frozen, so the lookup sets derived
+    in __post_init__ cannot go stale.
     """
     # Core identifiers
     id: int
@@ -97,20 +198,28 @@ class DocumentSnapshot:
     storage_path: str | None
     archive_serial_number: int | None
 
+    # Tag lookup sets, derived from tag_names/tag_ids
+    tag_names_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    tag_id_set: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tag_names_lower", frozenset(t.lower() for t in self.tag_names))
+        object.__setattr__(self, "tag_id_set", frozenset(self.tag_ids))
+
     def get_custom_field(self, field_name: str) -> Any:
         """Get custom field value by name."""
         return self.custom_fields.get(field_name)
 
     def has_tag(self, tag_name: str) -> bool:
         """Check if document has a tag by name."""
-        return tag_name.lower() in [t.lower() for t in self.tag_names]
+        return tag_name.lower() in self.tag_names_lower
 
     def has_tag_id(self, tag_id: int) -> bool:
         """Check if document has a tag by ID."""
-        return tag_id in self.tag_ids
+        return tag_id in self.tag_id_set
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentPatch:
     """Changes to apply to a document."""
     title: str | None = None
@@ -133,6 +242,9 @@ class DocumentPatch:
 
     def to_api_payload(self, current_tags: list[int]) -> dict[str, Any]:
         """Convert to Paperless API payload."""
+        if self.is_empty():
+            return {}
+
         payload: dict[str, Any] = {}
 
         if self.title is not None:
@@ -146,10 +258,8 @@ class DocumentPatch:
 
         # Handle tags: compute final tag list
         if self.tags_add or self.tags_remove:
-            new_tags = set(current_tags)
-            new_tags.update(self.tags_add)
-            new_tags.difference_update(self.tags_remove)
-            payload["tags"] = list(new_tags)
+            new_tags = set(current_tags).union(self.tags_add).difference(self.tags_remove)
+            payload["tags"] = sorted(new_tags)
 
         # Handle custom fields
         if self.custom_fields:
@@ -170,17 +280,23 @@ class PaperlessClient:
         self.base_url = config.url
         self._client: httpx.Client | None = None
 
-        # Caches for metadata lookups
-        self._tag_cache: dict[str, Tag] = {}
-        self._correspondent_cache: dict[str, Correspondent] = {}
-        self._document_type_cache: dict[str, DocumentType] = {}
-        self._custom_field_cache: dict[str, CustomField] = {}
+        # Caches for metadata lookups; entries expire so renames in
+        # Paperless are picked up by long-running processes
+        ttl = config.cache_ttl_seconds
+        self._tag_cache: _TTLCache[str, Tag] = _TTLCache(ttl)
+        self._correspondent_cache: _TTLCache[str, Correspondent] = _TTLCache(ttl)
+        self._document_type_cache: _TTLCache[str, DocumentType] = _TTLCache(ttl)
+        self._custom_field_cache: _TTLCache[str, CustomField] = _TTLCache(ttl)
 
         # ID to name reverse lookups
-        self._tag_id_cache: dict[int, str] = {}
-        self._correspondent_id_cache: dict[int, str] = {}
-        self._document_type_id_cache: dict[int, str] = {}
-        self._custom_field_id_cache: dict[int, str] = {}
+        self._tag_id_cache: _TTLCache[int, str] = _TTLCache(ttl)
+        self._correspondent_id_cache: _TTLCache[int, str] = _TTLCache(ttl)
+        self._document_type_id_cache: _TTLCache[int, str] = _TTLCache(ttl)
+        self._custom_field_id_cache: _TTLCache[int, str] = _TTLCache(ttl)
+
+        # Lookup statistics (see cache_stats)
+        self._hit_count = 0
+        self._miss_count = 0
 
     @property
     def client(self) -> httpx.Client:
@@ -193,12 +309,23 @@ class PaperlessClient:
                     "Content-Type": "application/json",
                 },
                 timeout=httpx.Timeout(self.config.timeout_seconds),
-                verify=self.config.verify_ssl,
+                transport=httpx.HTTPTransport(
+                    verify=self.config.verify_ssl,
+                    http2=_HTTP2_AVAILABLE,
+                    limits=_POOL_LIMITS,
+                    retries=_CONNECT_RETRIES,
+                ),
             )
         return self._client
 
     def close(self) -> None:
         """Close the HTTP client."""
+        stats = self.cache_stats()
+        if stats["hits"] or stats["misses"]:
+            logger.debug(
+                f"Metadata cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate)"
+            )
         if self._client and not self._client.is_closed:
             self._client.close()
             self._client = None
@@ -224,51 +351,169 @@ class PaperlessClient:
                 response_body=response.text,
             )
 
-    # =========================================================================
-    # Document Operations
-    # =========================================================================
+    def _store_tag(self, data: dict[str, Any]) -> str | None:
+        """Cache a tag from its API representation and return its name."""
+        name = data.get("name")
+        if name:
+            self._tag_id_cache[data["id"]] = name
+            self._tag_cache[name.lower()] = Tag(
+                id=data["id"],
+                name=name,
+                slug=data.get("slug", ""),
+                color=data.get("color", ""),
+            )
+        return name
 
-    def get_document_snapshot(self, doc_id: int) -> DocumentSnapshot:
-        """Fetch a document and return an immutable snapshot.
+    def _store_correspondent(self, data: dict[str, Any]) -> str | None:
+        """Cache a correspondent from its API representation and return its name."""
+        name = data.get("name")
+        if name:
+            self._correspondent_id_cache[data["id"]] = name
+            self._correspondent_cache[name.lower()] = Correspondent(
+                id=data["id"],
+                name=name,
+                slug=data.get("slug", ""),
+            )
+        return name
 
-        This is the primary method for the state pipeline.
+    def _store_document_type(self, data: dict[str, Any]) -> str | None:
+        """Cache a document type from its API representation and return its name."""
+        name = data.get("name")
+        if name:
+            self._document_type_id_cache[data["id"]] = name
+            self._document_type_cache[name.lower()] = DocumentType(
+                id=data["id"],
+                name=name,
+                slug=data.get("slug", ""),
+            )
+        return name
+
+    def _store_custom_field(self, data: dict[str, Any]) -> str | None:
+        """Cache a custom field from its API representation and return its name."""
+        name = data.get("name")
+        if name:
+            self._custom_field_id_cache[data["id"]] = name
+            self._custom_field_cache[name.lower()] = CustomField(
+                id=data["id"],
+                name=name,
+                data_type=data.get("data_type", "string"),
+            )
+        return name
+
+    @staticmethod
+    def _document_params(include_content: bool) -> dict[str, str] | None:
+        """Query parameters for a document GET, limiting fields if needed."""
+        return None if include_content else {"fields": _METADATA_FIELDS}
+
+    def _id_filter_params(self, ids: set[int]) -> dict[str, Any]:
+        """Query parameters selecting the given IDs from a list endpoint."""
+        return {"id__in": ",".join(map(str, sorted(ids))), "page_size": len(ids)}
+
+    def _metadata_lookups(
+        self, data: dict[str, Any]
+    ) -> list[tuple[str, set[int], Callable[[dict[str, Any]], str | None]]]:
+        """List the uncached metadata IDs a document refers to, per endpoint.
+
+        Returns:
+            (endpoint, missing IDs, store function) for each kind with misses.
         """
-        logger.debug(f"Fetching document {doc_id}")
+        wanted = (
+            ("/tags/", data.get("tags", []), self._tag_id_cache, self._store_tag),
+            (
+                "/correspondents/",
+                [data.get("correspondent")],
+                self._correspondent_id_cache,
+                self._store_correspondent,
+            ),
+            (
+                "/document_types/",
+                [data.get("document_type")],
+                self._document_type_id_cache,
+                self._store_document_type,
+            ),
+            (
+                "/custom_fields/",
+                [cf["field"] for cf in data.get("custom_fields", [])],
+                self._custom_field_id_cache,
+                self._store_custom_field,
+            ),
+        )
+        lookups: list[tuple[str, set[int], Callable[[dict[str, Any]], str | None]]] = []
+        for endpoint, ids, id_cache, store in wanted:
+            wanted_ids = {i for i in ids if i}
+            missing = {i for i in wanted_ids if i not in id_cache}
+            self._hit_count += len(wanted_ids) - len(missing)
+            self._miss_count += len(missing)
+            if missing:
+                lookups.append((endpoint, missing, store))
+        return lookups
+
+    def _metadata_endpoints(self) -> list[tuple[str, Callable[[dict[str, Any]], str | None]]]:
+        """List endpoints loaded by preload_cache, with their store functions."""
+        return [
+            ("/tags/", self._store_tag),
+            ("/correspondents/", self._store_correspondent),
+            ("/document_types/", self._store_document_type),
+            ("/custom_fields/", self._store_custom_field),
+        ]
+
+    @staticmethod
+    def _remaining_pages(first_page: dict[str, Any]) -> range:
+        """Page numbers still to fetch after the first page of a list endpoint.
+
+        The page size is taken from the first page, so a server-side cap on
+        page_size is handled.
+        """
+        page_size = len(first_page.get("results", []))
+        if not first_page.get("next") or not page_size:
+            return range(0)
+        total_pages = -(-first_page.get("count", 0) // page_size)
+        return range(2, total_pages + 1)
+
+    def _log_cache_sizes(self) -> None:
+        """Log how many objects of each kind are cached."""
+        logger.info(
+            f"Cache loaded: {len(self._tag_cache)} tags, "
+            f"{len(self._correspondent_cache)} correspondents, "
+            f"{len(self._document_type_cache)} doc types, "
+            f"{len(self._custom_field_cache)} custom fields"
+        )
 
-        response = self.client.get(f"/documents/{doc_id}/")
-        self._handle_response_error(response, f"get document {doc_id}")
-        data = response.json()
+    def _build_snapshot(self, data: dict[str, Any]) -> DocumentSnapshot:
+        """Build a snapshot from a document payload.
 
-        # Resolve tag names
+        Names are read from the ID caches; IDs missing from them (deleted
+        objects) are left unresolved.
+        """
         tag_ids = data.get("tags", [])
-        tag_names = []
-        for tag_id in tag_ids:
-            name = self._resolve_tag_name(tag_id)
-            if name:
-                tag_names.append(name)
+        tag_names = [name for name in map(self._tag_id_cache.get, tag_ids) if name]
 
-        # Resolve correspondent name
         correspondent_id = data.get("correspondent")
-        correspondent_name = None
-        if correspondent_id:
-            correspondent_name = self._resolve_correspondent_name(correspondent_id)
-
-        # Resolve document type name
+        correspondent_name = (
+            self._correspondent_id_cache.get(correspondent_id)
+            if correspondent_id is not None
+            else None
+        )
         document_type_id = data.get("document_type")
-        document_type_name = None
-        if document_type_id:
-            document_type_name = self._resolve_document_type_name(document_type_id)
+        document_type_name = (
+            self._document_type_id_cache.get(document_type_id)
+            if document_type_id is not None
+            else None
+        )
 
-        # Parse custom fields into dict
         custom_fields: dict[str, Any] = {}
         for cf in data.get("custom_fields", []):
-            field_name = self._resolve_custom_field_name(cf["field"])
+            field_name = self._custom_field_id_cache.get(cf["field"])
             if field_name:
                 custom_fields[field_name] = cf.get("value")
 
-        # Compute content hash
-        content = data.get("content", "")
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        # Compute content hash (64-bit, 16 hex chars); left empty when the
+        # content was not requested
+        content = data.get("content")
+        if content is None:
+            content, content_hash = "", ""
+        else:
+            content_hash = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
         return DocumentSnapshot(
             id=data["id"],
@@ -291,6 +536,73 @@ class PaperlessClient:
             archive_serial_number=data.get("archive_serial_number"),
         )
 
+    def clear_cache(self) -> None:
+        """Clear all metadata caches."""
+        self._tag_cache.clear()
+        self._correspondent_cache.clear()
+        self._document_type_cache.clear()
+        self._custom_field_cache.clear()
+        self._tag_id_cache.clear()
+        self._correspondent_id_cache.clear()
+        self._document_type_id_cache.clear()
+        self._custom_field_id_cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return metadata cache hit/miss counts and current sizes."""
+        lookups = self._hit_count + self._miss_count
+        return {
+            "hits": self._hit_count,
+            "misses": self._miss_count,
+            "hit_rate": self._hit_count / lookups if lookups else 0.0,
+            "tags": len(self._tag_cache),
+            "correspondents": len(self._correspondent_cache),
+            "document_types": len(self._document_type_cache),
+            "custom_fields": len(self._custom_field_cache),
+        }
+
+    # =========================================================================
+    # Document Operations
+    # =========================================================================
+
+    def get_document_snapshot(self, doc_id: int, include_content: bool = True) -> DocumentSnapshot:
+        """Fetch a document and return an immutable snapshot.
+
+        This is the primary method for the state pipeline.
+
+        Args:
+            doc_id: Document ID to fetch.
+            include_content: Download the OCR content. When False, only
+                metadata is requested and the snapshot's content and
+                content_hash are empty.
+        """
+        logger.debug(f"Fetching document {doc_id}")
+
+        response = self.client.get(
+            f"/documents/{doc_id}/", params=self._document_params(include_content)
+        )
+        self._handle_response_error(response, f"get document {doc_id}")
+        return self._snapshot_from_data(_json_loads(response.content))
+
+    def _snapshot_from_data(self, data: dict[str, Any]) -> DocumentSnapshot:
+        """Resolve a document payload's metadata names and build its snapshot."""
+        # One list request per metadata kind with uncached IDs
+        for endpoint, missing, store in self._metadata_lookups(data):
+            self._bulk_resolve(endpoint, missing, store)
+
+        return self._build_snapshot(data)
+
+    def _bulk_resolve(
+        self,
+        endpoint: str,
+        ids: set[int],
+        store: Callable[[dict[str, Any]], str | None],
+    ) -> None:
+        """Fetch and cache several metadata objects with a single id__in request."""
+        response = self.client.get(endpoint, params=self._id_filter_params(ids))
+        self._handle_response_error(response, f"list {endpoint}")
+        for item in _json_loads(response.content).get("results", []):
+            store(item)
+
     def patch_document(self, doc_id: int, patch: DocumentPatch, current_tags: list[int]) -> DocumentSnapshot:
         """Apply a patch to a document and return the new snapshot.
 
@@ -300,7 +612,8 @@ class PaperlessClient:
             current_tags: Current tag IDs (needed for tag operations).
 
         Returns:
-            New document snapshot after the patch.
+            New document snapshot after the patch, built from the updated
+            document that Paperless returns in the PATCH response.
         """
         payload = patch.to_api_payload(current_tags)
         if not payload:
@@ -312,108 +625,67 @@ class PaperlessClient:
         response = self.client.patch(f"/documents/{doc_id}/", json=payload)
         self._handle_response_error(response, f"patch document {doc_id}")
 
-        return self.get_document_snapshot(doc_id)
+        return self._snapshot_from_data(_json_loads(response.content))
 
-    # =========================================================================
-    # Tag Operations
-    # =========================================================================
+    def _get_by_name(
+        self,
+        kind: str,
+        endpoint: str,
+        cache: _TTLCache[str, M],
+        store: Callable[[dict[str, Any]], str | None],
+        name: str,
+    ) -> M | None:
+        """Find a metadata object by name (case-insensitive), caching the result.
 
-    def get_tag_by_name(self, name: str) -> Tag | None:
-        """Find a tag by name (case-insensitive)."""
-        cache_key = name.lower()
-        if cache_key in self._tag_cache:
-            return self._tag_cache[cache_key]
+        Args:
+            kind: Object kind, for error messages.
+            endpoint: List endpoint to search.
+            cache: Name cache for this kind (keyed by lowercased name).
+            store: Function that caches an object from its API representation.
+            name: Name to look up.
+        """
+        cached = cache.get(name.lower())
+        if cached is not None:
+            self._hit_count += 1
+            return cached
+        self._miss_count += 1
 
-        response = self.client.get("/tags/", params={"name__iexact": name})
-        self._handle_response_error(response, f"find tag {name}")
+        response = self.client.get(endpoint, params={"name__iexact": name})
+        self._handle_response_error(response, f"find {kind} {name}")
 
-        results = response.json().get("results", [])
+        results = _json_loads(response.content).get("results", [])
         if not results:
             return None
 
-        tag = Tag(
-            id=results[0]["id"],
-            name=results[0]["name"],
-            slug=results[0].get("slug", ""),
-            color=results[0].get("color", ""),
-        )
-        self._tag_cache[cache_key] = tag
-        self._tag_id_cache[tag.id] = tag.name
-        return tag
+        found = store(results[0])
+        return cache.get(found.lower()) if found else None
+
+    # =========================================================================
+    # Tag Operations
+    # =========================================================================
+
+    def get_tag_by_name(self, name: str) -> Tag | None:
+        """Find a tag by name (case-insensitive)."""
+        return self._get_by_name("tag", "/tags/", self._tag_cache, self._store_tag, name)
 
     def get_tag_id(self, name: str) -> int | None:
         """Get tag ID by name."""
         tag = self.get_tag_by_name(name)
         return tag.id if tag else None
 
-    def _resolve_tag_name(self, tag_id: int) -> str | None:
-        """Resolve tag ID to name."""
-        if tag_id in self._tag_id_cache:
-            return self._tag_id_cache[tag_id]
-
-        response = self.client.get(f"/tags/{tag_id}/")
-        if response.status_code == 404:
-            return None
-        self._handle_response_error(response, f"get tag {tag_id}")
-
-        data = response.json()
-        name = data.get("name")
-        if name:
-            self._tag_id_cache[tag_id] = name
-            self._tag_cache[name.lower()] = Tag(
-                id=data["id"],
-                name=name,
-                slug=data.get("slug", ""),
-                color=data.get("color", ""),
-            )
-        return name
-
     # =========================================================================
     # Correspondent Operations
     # =========================================================================
 
     def get_correspondent_by_name(self, name: str) -> Correspondent | None:
         """Find a correspondent by name (case-insensitive)."""
-        cache_key = name.lower()
-        if cache_key in self._correspondent_cache:
-            return self._correspondent_cache[cache_key]
-
-        response = self.client.get("/correspondents/", params={"name__iexact": name})
-        self._handle_response_error(response, f"find correspondent {name}")
-
-        results = response.json().get("results", [])
-        if not results:
-            return None
-
-        correspondent = Correspondent(
-            id=results[0]["id"],
-            name=results[0]["name"],
-            slug=results[0].get("slug", ""),
+        return self._get_by_name(
+            "correspondent",
+            "/correspondents/",
+            self._correspondent_cache,
+            self._store_correspondent,
+            name,
         )
-        self._correspondent_cache[cache_key] = correspondent
-        self._correspondent_id_cache[correspondent.id] = correspondent.name
-        return correspondent
-
-    def _resolve_correspondent_name(self, correspondent_id: int) -> str | None:
-        """Resolve correspondent ID to name."""
-        if correspondent_id in self._correspondent_id_cache:
-            return self._correspondent_id_cache[correspondent_id]
-
-        response = self.client.get(f"/correspondents/{correspondent_id}/")
-        if response.status_code == 404:
-            return None
-        self._handle_response_error(response, f"get correspondent {correspondent_id}")
-
-        data = response.json()
-        name = data.get("name")
-        if name:
-            self._correspondent_id_cache[correspondent_id] = name
-            self._correspondent_cache[name.lower()] = Correspondent(
-                id=data["id"],
-                name=name,
-                slug=data.get("slug", ""),
-            )
-        return name
 
     # =========================================================================
     # Document Type Operations
@@ -421,46 +693,13 @@ class PaperlessClient:
 
     def get_document_type_by_name(self, name: str) -> DocumentType | None:
         """Find a document type by name (case-insensitive)."""
-        cache_key = name.lower()
-        if cache_key in self._document_type_cache:
-            return self._document_type_cache[cache_key]
-
-        response = self.client.get("/document_types/", params={"name__iexact": name})
-        self._handle_response_error(response, f"find document type {name}")
-
-        results = response.json().get("results", [])
-        if not results:
-            return None
-
-        doc_type = DocumentType(
-            id=results[0]["id"],
-            name=results[0]["name"],
-            slug=results[0].get("slug", ""),
+        return self._get_by_name(
+            "document type",
+            "/document_types/",
+            self._document_type_cache,
+            self._store_document_type,
+            name,
         )
-        self._document_type_cache[cache_key] = doc_type
-        self._document_type_id_cache[doc_type.id] = doc_type.name
-        return doc_type
-
-    def _resolve_document_type_name(self, doc_type_id: int) -> str | None:
-        """Resolve document type ID to name."""
-        if doc_type_id in self._document_type_id_cache:
-            return self._document_type_id_cache[doc_type_id]
-
-        response = self.client.get(f"/document_types/{doc_type_id}/")
-        if response.status_code == 404:
-            return None
-        self._handle_response_error(response, f"get document type {doc_type_id}")
-
-        data = response.json()
-        name = data.get("name")
-        if name:
-            self._document_type_id_cache[doc_type_id] = name
-            self._document_type_cache[name.lower()] = DocumentType(
-                id=data["id"],
-                name=name,
-                slug=data.get("slug", ""),
-            )
-        return name
 
     # =========================================================================
     # Custom Field Operations
@@ -468,112 +707,62 @@ class PaperlessClient:
 
     def get_custom_field_by_name(self, name: str) -> CustomField | None:
         """Find a custom field by name (case-insensitive)."""
-        cache_key = name.lower()
-        if cache_key in self._custom_field_cache:
-            return self._custom_field_cache[cache_key]
-
-        response = self.client.get("/custom_fields/", params={"name__iexact": name})
-        self._handle_response_error(response, f"find custom field {name}")
-
-        results = response.json().get("results", [])
-        if not results:
-            return None
-
-        field = CustomField(
-            id=results[0]["id"],
-            name=results[0]["name"],
-            data_type=results[0].get("data_type", "string"),
+        return self._get_by_name(
+            "custom field",
+            "/custom_fields/",
+            self._custom_field_cache,
+            self._store_custom_field,
+            name,
         )
-        self._custom_field_cache[cache_key] = field
-        self._custom_field_id_cache[field.id] = field.name
-        return field
 
     def get_custom_field_id(self, name: str) -> int | None:
         """Get custom field ID by name."""
         field = self.get_custom_field_by_name(name)
         return field.id if field else None
 
-    def _resolve_custom_field_name(self, field_id: int) -> str | None:
-        """Resolve custom field ID to name."""
-        if field_id in self._custom_field_id_cache:
-            return self._custom_field_id_cache[field_id]
-
-        response = self.client.get(f"/custom_fields/{field_id}/")
-        if response.status_code == 404:
-            return None
-        self._handle_response_error(response, f"get custom field {field_id}")
-
-        data = response.json()
-        name = data.get("name")
-        if name:
-            self._custom_field_id_cache[field_id] = name
-            self._custom_field_cache[name.lower()] = CustomField(
-                id=data["id"],
-                name=name,
-                data_type=data.get("data_type", "string"),
-            )
-        return name
-
     # =========================================================================
     # Cache Operations
     # =========================================================================
 
     def preload_cache(self) -> None:
-        """Preload all metadata into cache for faster lookups."""
+        """Preload all metadata into cache for faster lookups.
+
+        The first page of every endpoint is fetched concurrently, then all
+        remaining pages at once, so the preload takes about two round-trips
+        instead of one per page.
+        """
         logger.info("Preloading metadata cache")
 
-        def load_all(endpoint: str) -> list[dict]:
-            items = []
-            page = 1
-            while True:
-                response = self.client.get(endpoint, params={"page": page})
-                if response.status_code != 200:
-                    break
-                data = response.json()
-                items.extend(data.get("results", []))
-                if not data.get("next"):
-                    break
-                page += 1
-            return items
-
-        # Load tags
-        for item in load_all("/tags/"):
-            tag = Tag(id=item["id"], name=item["name"], slug=item.get("slug", ""))
-            self._tag_cache[tag.name.lower()] = tag
-            self._tag_id_cache[tag.id] = tag.name
-
-        # Load correspondents
-        for item in load_all("/correspondents/"):
-            corr = Correspondent(id=item["id"], name=item["name"], slug=item.get("slug", ""))
-            self._correspondent_cache[corr.name.lower()] = corr
-            self._correspondent_id_cache[corr.id] = corr.name
-
-        # Load document types
-        for item in load_all("/document_types/"):
-            dt = DocumentType(id=item["id"], name=item["name"], slug=item.get("slug", ""))
-            self._document_type_cache[dt.name.lower()] = dt
-            self._document_type_id_cache[dt.id] = dt.name
-
-        # Load custom fields
-        for item in load_all("/custom_fields/"):
-            cf = CustomField(id=item["id"], name=item["name"], data_type=item.get("data_type", "string"))
-            self._custom_field_cache[cf.name.lower()] = cf
-            self._custom_field_id_cache[cf.id] = cf.name
+        # Create the HTTP client here; the lazy property is not thread-safe
+        client = self.client
+        endpoints = self._metadata_endpoints()
+        with ThreadPoolExecutor(max_workers=_PRELOAD_WORKERS) as executor:
+            first_pages = list(executor.map(lambda e: self._fetch_page(client, e[0], 1), endpoints))
+            requests = [
+                (endpoint, page, store)
+                for (endpoint, store), first in zip(endpoints, first_pages, strict=True)
+                if first
+                for page in self._remaining_pages(first)
+            ]
+            other_pages = list(
+                executor.map(lambda r: self._fetch_page(client, r[0], r[1]), requests)
+            )
 
-        logger.info(
-            f"Cache loaded: {len(self._tag_cache)} tags, "
-            f"{len(self._correspondent_cache)} correspondents, "
-            f"{len(self._document_type_cache)} doc types, "
-            f"{len(self._custom_field_cache)} custom fields"
-        )
+        # Fill the caches on this thread only
+        stores = [store for _, store in endpoints] + [store for _, _, store in requests]
+        for store, data in zip(stores, first_pages + other_pages, strict=True):
+            if data:
+                for item in data.get("results", []):
+                    store(item)
+
+        self._log_cache_sizes()
+
+    @staticmethod
+    def _fetch_page(client: httpx.Client, endpoint: str, page: int) -> dict[str, Any] | None:
+        """Fetch one page of a list endpoint, or None if the request failed."""
+        response = client.get(endpoint, params={"page": page, "page_size": _PAGE_SIZE})
+        if response.status_code != 200:
+            return None
+        data: dict[str, Any] = _json_loads(response.content)
+        return data
 
-    def clear_cache(self) -> None:
-        """Clear all metadata caches."""
-        self._tag_cache.clear()
-        self._correspondent_cache.clear()
-        self._document_type_cache.clear()
-        self._custom_field_cache.clear()
-        self._tag_id_cache.clear()
-        self._correspondent_id_cache.clear()
-        self._document_type_id_cache.clear()
-        self._custom_field_id_cache.clear()
@@ -1,16 +1,50 @@
 """PaperSqueeze CLI - Command-line interface."""
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from papersqueeze.config.loader import load_config
-from papersqueeze.config.schema import AppConfig
-from papersqueeze.api.paperless import PaperlessClient, DocumentSnapshot
 from papersqueeze.exceptions import PaperSqueezeError, ConfigurationError
 
+# The Paperless client (httpx) and the pydantic schema are imported by the
+# commands that need them, so `papersqueeze --help` stays fast
+if TYPE_CHECKING:
+    from papersqueeze.api.paperless import DocumentSnapshot
+    from papersqueeze.config.schema import AppConfig
+
+
+def _json_dumps(data: dict[str, Any]) -> str:
+    """Serialize data as indented JSON with the standard library."""
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+
+
+try:
+    import orjson
+except ImportError:
+    _dumps = _json_dumps
+else:
+    # Leave dates and dataclasses to default=str, as json does, so the
+    # output doesn't depend on whether orjson is installed
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _orjson_dumps(data: dict[str, Any]) -> str:
+        """Serialize data as indented JSON with orjson."""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS, default=str).decode()
+
+    _dumps = _orjson_dumps
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure logging."""
@@ -30,7 +64,7 @@ def load_config_or_exit(config_path: str | None = None) -> AppConfig:
         sys.exit(1)
 
 
-def snapshot_to_dict(snapshot: DocumentSnapshot) -> dict:
+def snapshot_to_dict(snapshot: DocumentSnapshot) -> dict[str, Any]:
     """Convert snapshot to a dict for display."""
     return {
         "id": snapshot.id,
@@ -54,12 +88,19 @@ def snapshot_to_dict(snapshot: DocumentSnapshot) -> dict:
     }
 
 
+def format_json(data: dict[str, Any]) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    return _dumps(data)
+
+
 # =============================================================================
 # Commands
 # =============================================================================
 
 def cmd_info(args: argparse.Namespace, config: AppConfig) -> int:
     """Show current configuration and status."""
+    from papersqueeze.api.paperless import PaperlessClient
+
     print("PaperSqueeze Configuration")
     print("=" * 40)
     print(f"Paperless URL: {config.paperless.url}")
@@ -75,7 +116,12 @@ def cmd_info(args: argparse.Namespace, config: AppConfig) -> int:
     try:
         with PaperlessClient(config.paperless) as client:
             client.preload_cache()
+            stats = client.cache_stats()
             print("✓ Connection successful")
+            print(
+                f"  Cached: {stats['tags']} tags, {stats['correspondents']} correspondents, "
+                f"{stats['document_types']} doc types, {stats['custom_fields']} custom fields"
+            )
     except Exception as e:
         print(f"✗ Connection failed: {e}")
         return 1
@@ -85,6 +131,8 @@ def cmd_info(args: argparse.Namespace, config: AppConfig) -> int:
 
 def cmd_snapshot(args: argparse.Namespace, config: AppConfig) -> int:
     """Fetch and display document snapshot."""
+    from papersqueeze.api.paperless import PaperlessClient
+
     doc_id = args.doc_id
 
     try:
@@ -92,7 +140,7 @@ def cmd_snapshot(args: argparse.Namespace, config: AppConfig) -> int:
             snapshot = client.get_document_snapshot(doc_id)
 
             if args.json:
-                print(json.dumps(snapshot_to_dict(snapshot), indent=2, default=str))
+                print(format_json(snapshot_to_dict(snapshot)))
             else:
                 print(f"Document {doc_id} Snapshot")
                 print("=" * 40)
@@ -127,6 +175,8 @@ def cmd_snapshot(args: argparse.Namespace, config: AppConfig) -> int:
 
 def cmd_process(args: argparse.Namespace, config: AppConfig) -> int:
     """Process a document (MVP: just snapshot for now)."""
+    from papersqueeze.api.paperless import PaperlessClient
+
     doc_id = args.doc_id
     logger = logging.getLogger("papersqueeze")
 
@@ -177,6 +227,8 @@ def cmd_process(args: argparse.Namespace, config: AppConfig) -> int:
 
 def cmd_test_api(args: argparse.Namespace, config: AppConfig) -> int:
     """Test API connectivity and list metadata."""
+    from papersqueeze.api.paperless import PaperlessClient
+
     print("Testing Paperless-ngx API...")
     print()
 
@@ -218,12 +270,26 @@ def cmd_test_api(args: argparse.Namespace, config: AppConfig) -> int:
 # Main Entry Point
 # =============================================================================
 
-def main() -> int:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        prog="papersqueeze",
-        description="PaperSqueeze - Intelligent document processing for Paperless-ngx",
-    )
+def _add_snapshot_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("doc_id", type=int, help="Document ID")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--content", action="store_true", help="Include content preview")
+
+
+def _add_process_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("doc_id", type=int, help="Document ID")
+
+
+# Subcommand name -> (help, function adding its arguments)
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None] | None]] = {
+    "info": ("Show configuration and test connection", None),
+    "test-api": ("Test API and list all metadata", None),
+    "snapshot": ("Get document snapshot", _add_snapshot_arguments),
+    "process": ("Process a document", _add_process_arguments),
+}
+
+
+def _add_global_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "-c", "--config",
         help="Path to config.yaml",
@@ -235,24 +301,37 @@ def main() -> int:
         help="Enable verbose logging",
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # info command
-    subparsers.add_parser("info", help="Show configuration and test connection")
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the argument parser, adding arguments only for the given subcommand.
+
+    Every subcommand is registered so it shows up in the help and is
+    accepted, but the others get no argument definitions.
+    """
+    parser = argparse.ArgumentParser(
+        prog="papersqueeze",
+        description="PaperSqueeze - Intelligent document processing for Paperless-ngx",
+    )
+    _add_global_arguments(parser)
 
-    # test-api command
-    subparsers.add_parser("test-api", help="Test API and list all metadata")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command and add_arguments:
+            add_arguments(subparser)
+
+    return parser
 
-    # snapshot command
-    snapshot_parser = subparsers.add_parser("snapshot", help="Get document snapshot")
-    snapshot_parser.add_argument("doc_id", type=int, help="Document ID")
-    snapshot_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    snapshot_parser.add_argument("--content", action="store_true", help="Include content preview")
 
-    # process command
-    process_parser = subparsers.add_parser("process", help="Process a document")
-    process_parser.add_argument("doc_id", type=int, help="Document ID")
+def main() -> int:
+    """Main CLI entry point."""
+    # Find the subcommand first so only its parser gets built
+    preparser = argparse.ArgumentParser(prog="papersqueeze", add_help=False)
+    _add_global_arguments(preparser)
+    preparser.add_argument("command", nargs="?")
+    command = preparser.parse_known_args()[0].command
 
+    parser = _build_parser(command if command in _SUBCOMMANDS else None)
     args = parser.parse_args()
 
     if not args.command:
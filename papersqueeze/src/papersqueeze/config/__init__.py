@@ -1,6 +1,19 @@
 """Configuration management for PaperSqueeze."""
 
+from typing import TYPE_CHECKING, Any
+
 from papersqueeze.config.loader import load_config
-from papersqueeze.config.schema import AppConfig
+
+if TYPE_CHECKING:
+    from papersqueeze.config.schema import AppConfig
 
 __all__ = ["AppConfig", "load_config"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the pydantic schema only when AppConfig is first accessed."""
+    if name == "AppConfig":
+        from papersqueeze.config.schema import AppConfig
+
+        return AppConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
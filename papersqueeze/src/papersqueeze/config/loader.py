@@ -1,16 +1,24 @@
 """Configuration loading from YAML files and environment variables."""
 
+import copy
+import functools
+import hashlib
 import os
+import pickle
 import re
+import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
-from pydantic import ValidationError
-
-from papersqueeze.config.schema import AppConfig, TemplatesConfig
 from papersqueeze.exceptions import ConfigurationError
 
+# yaml, pydantic and the schema are imported where used, so importing this
+# module (e.g. for `papersqueeze --help`) stays cheap
+if TYPE_CHECKING:
+    from pydantic import ValidationError
+
+    from papersqueeze.config.schema import AppConfig, TemplatesConfig
+
 # Default config search paths
 DEFAULT_CONFIG_PATHS = [
     Path("config.yaml"),
@@ -30,34 +38,53 @@ DEFAULT_TEMPLATES_PATHS = [
 ENV_VAR_PATTERN = re.compile(r"\$\{([A-Z_][A-Z0-9_]*)(?::([^}]*))?\}")
 
 
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Resolve one ${VAR_NAME} / ${VAR_NAME:default} match."""
+    var_name, default = match.groups()
+    env_value = os.environ.get(var_name)
+
+    if env_value is not None:
+        return env_value
+    if default is not None:
+        return default
+    raise ConfigurationError(
+        f"Environment variable '{var_name}' is required but not set"
+    )
+
+
+_substitute_matches = ENV_VAR_PATTERN.sub
+
+
+def _substitute_string(value: str) -> str:
+    """Substitute environment variables in a single string."""
+    # Most strings hold no placeholder; skip the regex scan for them
+    if "$" not in value:
+        return value
+    return _substitute_matches(_replace_env_var, value)
+
+
 def _substitute_env_vars(value: Any) -> Any:
-    """Recursively substitute environment variables in config values.
+    """Substitute environment variables throughout parsed config values.
 
     Supports patterns:
     - ${VAR_NAME} - Required, raises error if not set
     - ${VAR_NAME:default} - Optional with default value
+
+    Dicts and lists are walked iteratively and updated in place, so callers
+    must pass data they own (_load_yaml_file returns a private copy).
     """
     if isinstance(value, str):
-        def replacer(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            default = match.group(2)
-            env_value = os.environ.get(var_name)
-
-            if env_value is not None:
-                return env_value
-            if default is not None:
-                return default
-            raise ConfigurationError(
-                f"Environment variable '{var_name}' is required but not set"
-            )
-
-        return ENV_VAR_PATTERN.sub(replacer, value)
-
-    if isinstance(value, dict):
-        return {k: _substitute_env_vars(v) for k, v in value.items()}
-
-    if isinstance(value, list):
-        return [_substitute_env_vars(item) for item in value]
+        return _substitute_string(value)
+
+    stack = [value] if isinstance(value, (dict, list)) else []
+    while stack:
+        node = stack.pop()
+        for key, item in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(item, str):
+                if "$" in item:
+                    node[key] = _substitute_matches(_replace_env_var, item)
+            elif isinstance(item, (dict, list)):
+                stack.append(item)
 
     return value
 
@@ -66,30 +93,78 @@ def _find_config_file(
     explicit_path: Path | str | None,
     default_paths: list[Path],
     config_type: str,
+    env_var: str,
 ) -> Path:
-    """Find configuration file from explicit path or search default locations."""
+    """Find configuration file from explicit path, env var or default locations.
+
+    The explicit path wins, then the env_var environment variable; only when
+    neither is given are the default locations searched.
+    """
+    explicit_path = explicit_path or os.environ.get(env_var)
     if explicit_path:
         path = Path(explicit_path)
-        if not path.exists():
+        if not os.path.isfile(path):
             raise ConfigurationError(f"{config_type} file not found: {path}")
         return path
 
+    return _search_default_paths(tuple(default_paths), config_type, env_var, os.getcwd())
+
+
+@functools.lru_cache(maxsize=4)
+def _search_default_paths(
+    default_paths: tuple[Path, ...],
+    config_type: str,
+    env_var: str,
+    cwd: str,
+) -> Path:
+    """Return the first existing default path; cwd keys the cache for relative paths."""
     for path in default_paths:
-        if path.exists():
+        if os.path.isfile(path):
             return path
 
     searched = ", ".join(str(p) for p in default_paths)
     raise ConfigurationError(
         f"No {config_type} file found. Searched: {searched}. "
-        f"Create one or set PAPERSQUEEZE_CONFIG environment variable."
+        f"Create one or set {env_var} environment variable."
     )
 
 
 def _load_yaml_file(path: Path) -> dict[str, Any]:
-    """Load and parse YAML file."""
+    """Load and parse YAML file.
+
+    Parsed files are cached by (path, mtime, size), so an unchanged file is
+    parsed once per process. Callers get their own copy of the data.
+    """
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise ConfigurationError(f"Failed to read file {path}: {e}") from e
+
+    data = _load_yaml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data)
+
+
+def _yaml_loader() -> Any:
+    """Return the fastest available safe YAML loader class."""
+    try:
+        # libyaml-backed parser; much faster on large templates files
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file; mtime_ns and size only key the cache."""
+    import yaml
+
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_yaml_loader())
             if data is None:
                 return {}
             if not isinstance(data, dict):
@@ -101,7 +176,15 @@ def _load_yaml_file(path: Path) -> dict[str, Any]:
         raise ConfigurationError(f"Failed to read file {path}: {e}") from e
 
 
-def load_config(config_path: Path | str | None = None) -> AppConfig:
+def _format_validation_error(error: "ValidationError", path: Path, kind: str) -> str:
+    """Format a pydantic ValidationError as one indented line per problem."""
+    error_list = "\n".join(
+        f"  - {'.'.join(map(str, err['loc']))}: {err['msg']}" for err in error.errors()
+    )
+    return f"{kind} validation failed for {path}:\n{error_list}"
+
+
+def load_config(config_path: Path | str | None = None) -> "AppConfig":
     """Load application configuration from YAML file.
 
     Args:
@@ -114,12 +197,9 @@ def load_config(config_path: Path | str | None = None) -> AppConfig:
     Raises:
         ConfigurationError: If config file not found or validation fails.
     """
-    # Check environment variable for config path
-    env_config_path = os.environ.get("PAPERSQUEEZE_CONFIG")
-    if env_config_path and not config_path:
-        config_path = env_config_path
-
-    path = _find_config_file(config_path, DEFAULT_CONFIG_PATHS, "Configuration")
+    path = _find_config_file(
+        config_path, DEFAULT_CONFIG_PATHS, "Configuration", "PAPERSQUEEZE_CONFIG"
+    )
     raw_config = _load_yaml_file(path)
 
     # Substitute environment variables
@@ -131,38 +211,122 @@ def load_config(config_path: Path | str | None = None) -> AppConfig:
         raise ConfigurationError(f"Failed to substitute environment variables: {e}") from e
 
     # Validate with Pydantic
+    from pydantic import ValidationError
+
+    from papersqueeze.config.schema import AppConfig
+
     try:
         return AppConfig.model_validate(substituted)
     except ValidationError as e:
-        errors = []
-        for err in e.errors():
-            loc = ".".join(str(x) for x in err["loc"])
-            errors.append(f"  - {loc}: {err['msg']}")
-        error_list = "\n".join(errors)
-        raise ConfigurationError(
-            f"Configuration validation failed for {path}:\n{error_list}"
-        ) from e
+        raise ConfigurationError(_format_validation_error(e, path, "Configuration")) from e
+
+
+def _cache_dir() -> Path:
+    """Return the per-user cache directory ($XDG_CACHE_HOME/papersqueeze)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "papersqueeze"
+
+
+def _templates_cache_file(path: Path) -> Path | None:
+    """Return the pickle cache file for a templates file, or None if unreadable.
+
+    The name is a digest of everything the validated result depends on: the
+    file's bytes, the environment variables it references, and the
+    package, schema and pydantic versions.
+    """
+    from pydantic.version import VERSION as PYDANTIC_VERSION
+
+    from papersqueeze import __version__
+
+    try:
+        content = path.read_bytes()
+        schema_mtime = os.stat(Path(__file__).with_name("schema.py")).st_mtime_ns
+    except OSError:
+        return None
+
+    digest = hashlib.blake2b(content, digest_size=16)
+    text = content.decode("utf-8", "replace")
+    for name in sorted({m.group(1) for m in ENV_VAR_PATTERN.finditer(text)}):
+        digest.update(f"\0{name}={os.environ.get(name)}".encode())
+    digest.update(f"\0{__version__}\0{schema_mtime}\0{PYDANTIC_VERSION}".encode())
 
+    return _cache_dir() / f"templates.{digest.hexdigest()}.pkl"
 
-def load_templates(templates_path: Path | str | None = None) -> TemplatesConfig:
+
+def _read_templates_cache(cache_file: Path) -> "TemplatesConfig | None":
+    """Load a pickled TemplatesConfig, or None if missing or unreadable."""
+    try:
+        with open(cache_file, "rb") as f:
+            templates = pickle.load(f)
+    except Exception:
+        # Missing, truncated or written by an incompatible version
+        return None
+
+    from papersqueeze.config.schema import TemplatesConfig
+
+    if not isinstance(templates, TemplatesConfig):
+        return None
+    _intern_field_names(templates)
+    return templates
+
+
+def _intern_field_names(templates: "TemplatesConfig") -> None:
+    """Re-intern the field names the schema validators intern.
+
+    Unpickled strings are fresh objects, not the interned ones, so the
+    names are interned again and each template's name indexes rebuilt.
+    """
+    for template in templates.templates:
+        if template.extraction:
+            for template_field in template.extraction.fields:
+                template_field.name = sys.intern(template_field.name)
+        template.field_mapping = {
+            sys.intern(k): sys.intern(name) for k, name in template.field_mapping.items()
+        }
+        template.model_post_init(None)
+
+
+def _write_templates_cache(cache_file: Path, templates: "TemplatesConfig") -> None:
+    """Pickle a validated TemplatesConfig; failures only cost the next startup."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(templates, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def load_templates(templates_path: Path | str | None = None) -> "TemplatesConfig":
     """Load templates configuration from YAML file.
 
     Args:
         templates_path: Explicit path to templates file. If None, searches default locations.
                        Can also be set via PAPERSQUEEZE_TEMPLATES environment variable.
 
+    With PAPERSQUEEZE_FAST_VALIDATE=1 the validated result is pickled under
+    ~/.cache/papersqueeze and reused while the file, the environment
+    variables it references and the installed versions are unchanged.
+    Without it nothing is written to disk.
+
     Returns:
         Validated TemplatesConfig instance.
 
     Raises:
         ConfigurationError: If templates file not found or validation fails.
     """
-    # Check environment variable for templates path
-    env_templates_path = os.environ.get("PAPERSQUEEZE_TEMPLATES")
-    if env_templates_path and not templates_path:
-        templates_path = env_templates_path
+    path = _find_config_file(
+        templates_path, DEFAULT_TEMPLATES_PATHS, "Templates", "PAPERSQUEEZE_TEMPLATES"
+    )
+
+    cache_file = None
+    if os.environ.get("PAPERSQUEEZE_FAST_VALIDATE") == "1":
+        cache_file = _templates_cache_file(path)
+        cached = _read_templates_cache(cache_file) if cache_file else None
+        if cached is not None:
+            return cached
 
-    path = _find_config_file(templates_path, DEFAULT_TEMPLATES_PATHS, "Templates")
     raw_templates = _load_yaml_file(path)
 
     # Substitute environment variables (rarely needed in templates, but supported)
@@ -174,23 +338,24 @@ def load_templates(templates_path: Path | str | None = None) -> TemplatesConfig:
         raise ConfigurationError(f"Failed to substitute environment variables: {e}") from e
 
     # Validate with Pydantic
+    from pydantic import ValidationError
+
+    from papersqueeze.config.schema import TemplatesConfig
+
     try:
-        return TemplatesConfig.model_validate(substituted)
+        templates = TemplatesConfig.model_validate(substituted)
     except ValidationError as e:
-        errors = []
-        for err in e.errors():
-            loc = ".".join(str(x) for x in err["loc"])
-            errors.append(f"  - {loc}: {err['msg']}")
-        error_list = "\n".join(errors)
-        raise ConfigurationError(
-            f"Templates validation failed for {path}:\n{error_list}"
-        ) from e
+        raise ConfigurationError(_format_validation_error(e, path, "Templates")) from e
+
+    if cache_file:
+        _write_templates_cache(cache_file, templates)
+    return templates
 
 
 def load_all_config(
     config_path: Path | str | None = None,
     templates_path: Path | str | None = None,
-) -> tuple[AppConfig, TemplatesConfig]:
+) -> tuple["AppConfig", "TemplatesConfig"]:
     """Load both application and templates configuration.
 
     Args:
@@ -1,9 +1,10 @@
 """Pydantic models for configuration validation."""
 
+import sys
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class LogLevel(str, Enum):
@@ -24,6 +25,11 @@ class PaperlessConfig(BaseModel):
     token: str = Field(description="API authentication token")
     verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
     timeout_seconds: int = Field(default=30, ge=5, le=300)
+    cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Lifetime of cached tag/correspondent/type/field lookups (0 = never expire)",
+    )
 
     @field_validator("url")
     @classmethod
@@ -94,13 +100,27 @@ class FieldMappingConfig(BaseModel):
     # Description
     short_desc: str | None = Field(default="gen_description")
 
+    # Semantic key -> Paperless field name, built once after validation
+    _mapping: dict[str, str | None] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the lookup dict used by get_paperless_field.
+
+        Field names are interned; the same few names recur across every
+        template and document, so lookups can match on identity.
+        """
+        self._mapping = {
+            sys.intern(k): sys.intern(v) if v is not None else None
+            for k, v in self.model_dump().items()
+        }
+
     def get_paperless_field(self, semantic_key: str) -> str | None:
         """Get the Paperless field name for a semantic key."""
-        return getattr(self, semantic_key, None)
+        return self._mapping.get(semantic_key)
 
     def to_dict(self) -> dict[str, str | None]:
         """Return all mappings as a dict."""
-        return self.model_dump()
+        return dict(self._mapping)
 
 
 class ProcessingConfig(BaseModel):
@@ -137,6 +157,12 @@ class TemplateField(BaseModel):
     required: bool = Field(default=False)
     description: str | None = Field(default=None)
 
+    @field_validator("name")
+    @classmethod
+    def intern_name(cls, v: str) -> str:
+        """Intern the name; it becomes the ExtractionResult.fields key."""
+        return sys.intern(v)
+
 
 class TemplateExtraction(BaseModel):
     """Extraction rules for a template."""
@@ -174,6 +200,40 @@ class Template(BaseModel):
     auto_commit: bool = Field(default=False, description="Remove from inbox automatically")
     min_confidence: float = Field(default=0.7)
 
+    _field_names: tuple[str, ...] = PrivateAttr(default=())
+    _required_field_names: tuple[str, ...] = PrivateAttr(default=())
+    _field_index: dict[str, bool] = PrivateAttr(default_factory=dict)
+
+    @field_validator("field_mapping")
+    @classmethod
+    def intern_field_mapping(cls, v: dict[str, str]) -> dict[str, str]:
+        """Intern field names, which repeat across templates."""
+        return {sys.intern(k): sys.intern(name) for k, name in v.items()}
+
+    def model_post_init(self, __context: Any) -> None:
+        """Collect the extraction field names."""
+        if self.extraction:
+            self._field_names = tuple(f.name for f in self.extraction.fields)
+            self._required_field_names = tuple(
+                f.name for f in self.extraction.fields if f.required
+            )
+            self._field_index = {f.name: f.required for f in self.extraction.fields}
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """Names of all extraction fields, in template order."""
+        return self._field_names
+
+    @property
+    def required_field_names(self) -> tuple[str, ...]:
+        """Names of the extraction fields marked required."""
+        return self._required_field_names
+
+    @property
+    def field_index(self) -> dict[str, bool]:
+        """Map of extraction field name to whether it is required."""
+        return self._field_index
+
 
 class BasePrompts(BaseModel):
     """Base prompts for AI operations."""
@@ -189,12 +249,28 @@ class TemplatesConfig(BaseModel):
     base_prompts: BasePrompts = Field(default_factory=BasePrompts)
     templates: list[Template] = Field(default_factory=list)
 
+    # Lookup indexes, built once after validation
+    _by_id: dict[str, Template] = PrivateAttr(default_factory=dict)
+    _by_correspondent_id: dict[int, Template] = PrivateAttr(default_factory=dict)
+    _correspondent_hints: list[tuple[str, Template]] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index templates by ID, correspondent ID and correspondent hint.
+
+        The first template listed wins when several share a key, matching
+        the order a linear scan would find them in.
+        """
+        for t in self.templates:
+            self._by_id.setdefault(t.id, t)
+            for correspondent_id in t.correspondent_ids:
+                self._by_correspondent_id.setdefault(correspondent_id, t)
+        self._correspondent_hints = [
+            (t.correspondent_hint.lower(), t) for t in self.templates if t.correspondent_hint
+        ]
+
     def get_template_by_id(self, template_id: str) -> Template | None:
         """Find template by ID."""
-        for template in self.templates:
-            if template.id == template_id:
-                return template
-        return None
+        return self._by_id.get(template_id)
 
     def get_template_ids(self) -> list[str]:
         """Get list of all template IDs."""
@@ -203,12 +279,12 @@ class TemplatesConfig(BaseModel):
     def find_template_for_correspondent(self, correspondent_id: int | None, correspondent_name: str | None) -> Template | None:
         """Find template matching a correspondent."""
         if correspondent_id:
-            for t in self.templates:
-                if correspondent_id in t.correspondent_ids:
-                    return t
+            template = self._by_correspondent_id.get(correspondent_id)
+            if template:
+                return template
         if correspondent_name:
             name_lower = correspondent_name.lower()
-            for t in self.templates:
-                if t.correspondent_hint and t.correspondent_hint.lower() in name_lower:
+            for hint, t in self._correspondent_hints:
+                if hint in name_lower:
                     return t
         return None
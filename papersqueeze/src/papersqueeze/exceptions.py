@@ -4,7 +4,13 @@ from typing import Any
 
 
 class PaperSqueezeError(Exception):
-    """Base exception for all PaperSqueeze errors."""
+    """Base exception for all PaperSqueeze errors.
+
+    Subclasses declare __slots__ for the attributes they add, so raising
+    one doesn't allocate an instance __dict__.
+    """
+
+    __slots__ = ("message", "details")
 
     def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
         self.message = message
@@ -15,12 +21,14 @@ class PaperSqueezeError(Exception):
 class ConfigurationError(PaperSqueezeError):
     """Configuration loading or validation failed."""
 
-    pass
+    __slots__ = ()
 
 
 class PaperlessAPIError(PaperSqueezeError):
     """Paperless-ngx API communication error."""
 
+    __slots__ = ("status_code", "response_body")
+
     def __init__(
         self,
         message: str,
@@ -43,6 +51,8 @@ class PaperlessAPIError(PaperSqueezeError):
 class PaperlessNotFoundError(PaperlessAPIError):
     """Resource not found in Paperless-ngx."""
 
+    __slots__ = ()
+
     def __init__(self, resource_type: str, identifier: str | int) -> None:
         super().__init__(
             f"{resource_type} not found: {identifier}",
@@ -54,6 +64,8 @@ class PaperlessNotFoundError(PaperlessAPIError):
 class PaperlessAuthError(PaperlessAPIError):
     """Authentication failed with Paperless-ngx."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed") -> None:
         super().__init__(message, status_code=401)
 
@@ -61,6 +73,8 @@ class PaperlessAuthError(PaperlessAPIError):
 class ClaudeAPIError(PaperSqueezeError):
     """Anthropic Claude API error."""
 
+    __slots__ = ("error_type",)
+
     def __init__(
         self,
         message: str,
@@ -77,6 +91,8 @@ class ClaudeAPIError(PaperSqueezeError):
 class ClaudeRateLimitError(ClaudeAPIError):
     """Claude API rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, retry_after: float | None = None) -> None:
         self.retry_after = retry_after
         super().__init__(
@@ -89,6 +105,8 @@ class ClaudeRateLimitError(ClaudeAPIError):
 class ExtractionError(PaperSqueezeError):
     """AI extraction failed or returned invalid data."""
 
+    __slots__ = ("template_id", "raw_response")
+
     def __init__(
         self,
         message: str,
@@ -111,12 +129,14 @@ class ExtractionError(PaperSqueezeError):
 class ClassificationError(ExtractionError):
     """Document classification failed."""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(PaperSqueezeError):
     """Data validation failed."""
 
+    __slots__ = ("field", "value")
+
     def __init__(
         self,
         field: str,
@@ -135,6 +155,8 @@ class ValidationError(PaperSqueezeError):
 class ReviewWorkflowError(PaperSqueezeError):
     """Review queue operation failed."""
 
+    __slots__ = ("doc_id",)
+
     def __init__(
         self,
         message: str,
@@ -151,6 +173,8 @@ class ReviewWorkflowError(PaperSqueezeError):
 class ProcessingError(PaperSqueezeError):
     """Document processing failed."""
 
+    __slots__ = ("doc_id", "stage")
+
     def __init__(
         self,
         message: str,
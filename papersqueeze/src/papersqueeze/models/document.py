@@ -1,9 +1,10 @@
 """Document data models."""
 
+from collections.abc import Callable
 from datetime import date, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class CustomFieldValue(BaseModel):
@@ -42,6 +43,24 @@ class Document(BaseModel):
     archive_serial_number: int | None = Field(default=None)
     original_file_name: str | None = Field(default=None)
 
+    # Tag lookup sets, built once from tags/tag_names
+    _tag_names_lower: frozenset[str] = PrivateAttr(default=frozenset())
+    _tag_id_set: frozenset[int] = PrivateAttr(default=frozenset())
+
+    # Custom field values by name and by ID (first entry wins)
+    _cf_by_name: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _cf_by_id: dict[int, Any] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the tag and custom field lookup tables."""
+        self._tag_names_lower = frozenset(t.lower() for t in self.tag_names)
+        self._tag_id_set = frozenset(self.tags)
+
+        for cf in self.custom_fields:
+            if cf.field_name is not None:
+                self._cf_by_name.setdefault(cf.field_name, cf.value)
+            self._cf_by_id.setdefault(cf.field, cf.value)
+
     @field_validator("created", mode="before")
     @classmethod
     def parse_created_date(cls, v: Any) -> date | None:
@@ -62,25 +81,32 @@ class Document(BaseModel):
 
     def get_custom_field_value(self, field_name: str) -> Any | None:
         """Get value of a custom field by name."""
-        for cf in self.custom_fields:
-            if cf.field_name == field_name:
-                return cf.value
-        return None
+        return self._cf_by_name.get(field_name)
 
     def get_custom_field_by_id(self, field_id: int) -> Any | None:
         """Get value of a custom field by ID."""
-        for cf in self.custom_fields:
-            if cf.field == field_id:
-                return cf.value
-        return None
+        return self._cf_by_id.get(field_id)
 
     def has_tag(self, tag_name: str) -> bool:
         """Check if document has a specific tag by name."""
-        return tag_name.lower() in [t.lower() for t in self.tag_names]
+        return tag_name.lower() in self._tag_names_lower
 
     def has_tag_id(self, tag_id: int) -> bool:
         """Check if document has a specific tag by ID."""
-        return tag_id in self.tags
+        return tag_id in self._tag_id_set
+
+
+# DocumentUpdate fields copied into the API payload, in payload order, with
+# an optional conversion; custom_fields is serialized separately
+_UPDATE_PAYLOAD_FIELDS: tuple[tuple[str, Callable[[Any], Any] | None], ...] = (
+    ("title", None),
+    ("created", date.isoformat),
+    ("correspondent", None),
+    ("document_type", None),
+    ("storage_path", None),
+    ("tags", None),
+    ("archive_serial_number", None),
+)
 
 
 class DocumentUpdate(BaseModel):
@@ -114,22 +140,11 @@ class DocumentUpdate(BaseModel):
 
         Only includes non-None fields.
         """
-        payload: dict[str, Any] = {}
-
-        if self.title is not None:
-            payload["title"] = self.title
-        if self.created is not None:
-            payload["created"] = self.created.isoformat()
-        if self.correspondent is not None:
-            payload["correspondent"] = self.correspondent
-        if self.document_type is not None:
-            payload["document_type"] = self.document_type
-        if self.storage_path is not None:
-            payload["storage_path"] = self.storage_path
-        if self.tags is not None:
-            payload["tags"] = self.tags
-        if self.archive_serial_number is not None:
-            payload["archive_serial_number"] = self.archive_serial_number
+        payload: dict[str, Any] = {
+            name: (convert(value) if convert else value)
+            for name, convert in _UPDATE_PAYLOAD_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
         if self.custom_fields is not None:
             payload["custom_fields"] = [
                 {"field": cf.field, "value": cf.value}
@@ -140,18 +155,8 @@ class DocumentUpdate(BaseModel):
 
     def is_empty(self) -> bool:
         """Check if update has no changes."""
-        return all(
-            v is None
-            for v in [
-                self.title,
-                self.created,
-                self.correspondent,
-                self.document_type,
-                self.storage_path,
-                self.tags,
-                self.custom_fields,
-                self.archive_serial_number,
-            ]
+        return self.custom_fields is None and all(
+            getattr(self, name) is None for name, _ in _UPDATE_PAYLOAD_FIELDS
         )
 
 
@@ -1,5 +1,6 @@
 """AI extraction result models."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -15,7 +16,11 @@ class FieldType(str, Enum):
     INTEGER = "integer"
 
 
-@dataclass
+# Plain string per field type; Enum.value goes through a descriptor on every access
+_FIELD_TYPE_VALUES = {field_type: field_type.value for field_type in FieldType}
+
+
+@dataclass(slots=True)
 class ExtractedField:
     """A single field extracted by AI."""
 
@@ -27,8 +32,11 @@ class ExtractedField:
     extraction_notes: str | None = None
 
     def __post_init__(self) -> None:
-        """Ensure confidence is in valid range."""
-        self.confidence = max(0.0, min(1.0, self.confidence))
+        """Ensure confidence is in valid range and intern the field name."""
+        # Usually already in range; only clamp when it isn't
+        if not 0.0 <= self.confidence <= 1.0:
+            self.confidence = max(0.0, min(1.0, self.confidence))
+        self.name = sys.intern(self.name)
 
     @property
     def is_confident(self) -> bool:
@@ -46,7 +54,7 @@ class ExtractedField:
         return self.normalized_value or self.raw_value
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of document classification by gatekeeper AI."""
 
@@ -58,7 +66,8 @@ class ClassificationResult:
 
     def __post_init__(self) -> None:
         """Ensure confidence is in valid range."""
-        self.confidence = max(0.0, min(1.0, self.confidence))
+        if not 0.0 <= self.confidence <= 1.0:
+            self.confidence = max(0.0, min(1.0, self.confidence))
 
     @property
     def is_confident(self) -> bool:
@@ -66,7 +75,7 @@ class ClassificationResult:
         return self.confidence >= 0.8
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of data extraction by specialist AI."""
 
@@ -79,7 +88,8 @@ class ExtractionResult:
 
     def __post_init__(self) -> None:
         """Ensure confidence is in valid range."""
-        self.template_confidence = max(0.0, min(1.0, self.template_confidence))
+        if not 0.0 <= self.template_confidence <= 1.0:
+            self.template_confidence = max(0.0, min(1.0, self.template_confidence))
 
     def get_field(self, name: str) -> ExtractedField | None:
         """Get extracted field by name."""
@@ -141,7 +151,7 @@ class ExtractionResult:
                     "raw_value": field.raw_value,
                     "normalized_value": field.normalized_value,
                     "confidence": field.confidence,
-                    "type": field.field_type.value,
+                    "type": _FIELD_TYPE_VALUES[field.field_type],
                 }
                 for name, field in self.fields.items()
             },
@@ -149,7 +159,7 @@ class ExtractionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposedChange:
     """A proposed change to a document field."""
 
@@ -171,7 +181,7 @@ class ProposedChange:
         return not self.is_fill and self.current_value != self.proposed_value
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a document."""
 
@@ -198,8 +208,18 @@ class ProcessingResult:
 
     @property
     def needs_review(self) -> bool:
-        """Check if document needs human review."""
-        return self.review_required or any(
-            change.is_change and change.confidence < 0.9
-            for change in self.proposed_changes
-        )
+        """Check if document needs human review.
+
+        True when review was requested or any change to an existing value
+        (ProposedChange.is_change) has confidence below 0.9.
+        """
+        if self.review_required:
+            return True
+        # is_change inlined; this runs for every change of every document
+        for change in self.proposed_changes:
+            current = change.current_value
+            if current is None or current == "":
+                continue
+            if change.confidence < 0.9 and current != change.proposed_value:
+                return True
+        return False
@@ -1,5 +1,8 @@
 """Document type processors."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from papersqueeze.processors.base import BaseProcessor
 from papersqueeze.processors.fines import FinesProcessor
 from papersqueeze.processors.general import GeneralProcessor
@@ -7,6 +10,7 @@ from papersqueeze.processors.tax import TaxProcessor
 from papersqueeze.processors.utilities import UtilitiesEnergyProcessor, UtilitiesWaterProcessor
 
 __all__ = [
+    "PROCESSOR_REGISTRY",
     "BaseProcessor",
     "FinesProcessor",
     "GeneralProcessor",
@@ -14,3 +18,17 @@ __all__ = [
     "UtilitiesEnergyProcessor",
     "UtilitiesWaterProcessor",
 ]
+
+# Processor class per template ID, built once at import (read-only)
+PROCESSOR_REGISTRY: Mapping[str, type[BaseProcessor]] = MappingProxyType(
+    {
+        processor_class.template_id: processor_class
+        for processor_class in (
+            UtilitiesEnergyProcessor,
+            UtilitiesWaterProcessor,
+            TaxProcessor,
+            FinesProcessor,
+            GeneralProcessor,
+        )
+    }
+)
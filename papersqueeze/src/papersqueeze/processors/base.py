@@ -1,7 +1,8 @@
 """Base processor class for document type handling."""
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import ABC
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from papersqueeze.config.schema import Template
 from papersqueeze.models.document import Document
@@ -15,6 +16,27 @@ from papersqueeze.utils.normalization import (
 )
 
 
+def _normalize_integer(value: str) -> str | None:
+    """Normalize a number and drop its fractional part."""
+    num = normalize_number(value)
+    if not num:
+        return None
+    try:
+        return str(int(float(num)))
+    except ValueError:
+        return num
+
+
+# Normalizer per field type; anything else is treated as text
+_NORMALIZERS: dict[FieldType, Callable[[str], str | None]] = {
+    FieldType.DATE: normalize_date,
+    FieldType.AMOUNT: normalize_amount,
+    FieldType.NUMBER: normalize_number,
+    FieldType.INTEGER: _normalize_integer,
+    FieldType.STRING: normalize_text,
+}
+
+
 class BaseProcessor(ABC):
     """Abstract base class for document type processors.
 
@@ -22,17 +44,17 @@ class BaseProcessor(ABC):
     and knows how to normalize extracted data and format titles.
     """
 
-    @property
-    @abstractmethod
-    def template_id(self) -> str:
-        """Unique identifier for this processor's template."""
-        ...
+    # Unique identifier for this processor's template
+    template_id: ClassVar[str]
+    # Human-readable description of document type
+    description: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description of document type."""
-        ...
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Require template_id and description on every processor class."""
+        super().__init_subclass__(**kwargs)
+        missing = [name for name in ("template_id", "description") if not hasattr(cls, name)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must define {', '.join(missing)}")
 
     def normalize_field(self, field: ExtractedField) -> ExtractedField:
         """Normalize a single extracted field based on its type.
@@ -46,28 +68,10 @@ class BaseProcessor(ABC):
         if field.raw_value is None:
             return field
 
-        normalized: str | None = None
-
-        match field.field_type:
-            case FieldType.DATE:
-                normalized = normalize_date(field.raw_value)
-            case FieldType.AMOUNT:
-                normalized = normalize_amount(field.raw_value)
-            case FieldType.NUMBER:
-                normalized = normalize_number(field.raw_value)
-            case FieldType.INTEGER:
-                num = normalize_number(field.raw_value)
-                if num:
-                    try:
-                        normalized = str(int(float(num)))
-                    except ValueError:
-                        normalized = num
-            case FieldType.STRING:
-                normalized = normalize_text(field.raw_value)
-            case _:
-                normalized = normalize_text(field.raw_value)
-
-        field.normalized_value = normalized
+        normalizer: Callable[[str], str | None] = _NORMALIZERS.get(
+            field.field_type, normalize_text
+        )
+        field.normalized_value = normalizer(field.raw_value)
         return field
 
     def normalize_extraction(self, extraction: ExtractionResult) -> ExtractionResult:
@@ -79,8 +83,10 @@ class BaseProcessor(ABC):
         Returns:
             Extraction result with normalized values.
         """
-        for field_name, field in extraction.fields.items():
-            self.normalize_field(field)
+        # Resolve the (possibly overridden) method once for the whole loop
+        normalize_field = self.normalize_field
+        for field in extraction.fields.values():
+            normalize_field(field)
 
         return extraction
 
@@ -101,12 +107,11 @@ class BaseProcessor(ABC):
             Formatted title string.
         """
         # Build values dict from extraction
-        values: dict[str, Any] = {}
-
-        for field_name, field in extraction.fields.items():
-            value = field.normalized_value or field.raw_value
-            if value:
-                values[field_name] = value
+        values: dict[str, Any] = {
+            field_name: value
+            for field_name, field in extraction.fields.items()
+            if (value := field.normalized_value or field.raw_value)
+        }
 
         # Add document date as fallback
         if "issue_date" not in values and document and document.created:
@@ -131,9 +136,7 @@ class BaseProcessor(ABC):
         errors = []
 
         # Check required fields
-        required_fields = [f.name for f in template.extraction.fields if f.required]
-
-        for field_name in required_fields:
+        for field_name in template.required_field_names:
             field = extraction.fields.get(field_name)
             if not field or not field.has_value:
                 errors.append(f"Required field '{field_name}' is missing")
@@ -9,10 +9,5 @@ class GeneralProcessor(BaseProcessor):
     This is the fallback processor used when no specific template matches.
     """
 
-    @property
-    def template_id(self) -> str:
-        return "fallback_general"
-
-    @property
-    def description(self) -> str:
-        return "General invoices and receipts"
+    template_id = "fallback_general"
+    description = "General invoices and receipts"
@@ -1,21 +1,27 @@
 """Utilities (energy/water) document processors."""
 
+import re
+
 from papersqueeze.models.document import Document
 from papersqueeze.models.extraction import ExtractionResult
 from papersqueeze.processors.base import BaseProcessor
 from papersqueeze.utils.normalization import normalize_number
 
+# Numbers exactly as normalize_number formats them (no units, no trailing
+# zeros), which it would return unchanged
+PLAIN_NUMBER_PATTERN = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d*[1-9])?")
+
+
+def _is_plain_number(value: str) -> bool:
+    """Check whether normalize_number would leave value unchanged."""
+    return PLAIN_NUMBER_PATTERN.fullmatch(value) is not None
+
 
 class UtilitiesEnergyProcessor(BaseProcessor):
     """Processor for electricity and gas invoices (Iberdrola, EDP, etc.)."""
 
-    @property
-    def template_id(self) -> str:
-        return "utilities_energy"
-
-    @property
-    def description(self) -> str:
-        return "Electricity and Gas invoices (Iberdrola, EDP)"
+    template_id = "utilities_energy"
+    description = "Electricity and Gas invoices (Iberdrola, EDP)"
 
     def post_process(
         self,
@@ -28,21 +34,23 @@ class UtilitiesEnergyProcessor(BaseProcessor):
         - Format contract power properly
         """
         # Clean up consumption value
-        if "consumption_kwh" in extraction.fields:
-            field = extraction.fields["consumption_kwh"]
-            if field.normalized_value:
-                # Ensure no units in the normalized value
-                field.normalized_value = normalize_number(field.normalized_value)
+        field = extraction.fields.get("consumption_kwh")
+        if (
+            field is not None
+            and field.normalized_value
+            and not _is_plain_number(field.normalized_value)
+        ):
+            # Ensure no units in the normalized value
+            field.normalized_value = normalize_number(field.normalized_value)
 
         # Normalize contract power format
-        if "contract_power" in extraction.fields:
-            field = extraction.fields["contract_power"]
-            if field.raw_value:
-                # Keep the kVA unit in the display value
-                raw = field.raw_value.lower()
-                if "kva" not in raw and field.normalized_value:
-                    # Add kVA if missing
-                    field.normalized_value = f"{field.normalized_value} kVA"
+        field = extraction.fields.get("contract_power")
+        if field is not None and field.raw_value:
+            # Keep the kVA unit in the display value
+            raw = field.raw_value.lower()
+            if "kva" not in raw and field.normalized_value:
+                # Add kVA if missing
+                field.normalized_value = f"{field.normalized_value} kVA"
 
         return extraction
 
@@ -50,13 +58,8 @@ class UtilitiesEnergyProcessor(BaseProcessor):
 class UtilitiesWaterProcessor(BaseProcessor):
     """Processor for water invoices (EPAL, etc.)."""
 
-    @property
-    def template_id(self) -> str:
-        return "utilities_water"
-
-    @property
-    def description(self) -> str:
-        return "Water invoices (EPAL)"
+    template_id = "utilities_water"
+    description = "Water invoices (EPAL)"
 
     def post_process(
         self,
@@ -68,10 +71,13 @@ class UtilitiesWaterProcessor(BaseProcessor):
         - Ensure consumption is a clean number (no m3 suffix)
         """
         # Clean up consumption value
-        if "consumption_vol" in extraction.fields:
-            field = extraction.fields["consumption_vol"]
-            if field.normalized_value:
-                # Ensure no units in the normalized value
-                field.normalized_value = normalize_number(field.normalized_value)
+        field = extraction.fields.get("consumption_vol")
+        if (
+            field is not None
+            and field.normalized_value
+            and not _is_plain_number(field.normalized_value)
+        ):
+            # Ensure no units in the normalized value
+            field.normalized_value = normalize_number(field.normalized_value)
 
         return extraction
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import mul
 
 from papersqueeze.config.schema import Template
 from papersqueeze.models.extraction import ExtractionResult
@@ -17,18 +18,49 @@ class ConfidenceFactor(str, Enum):
     REQUIRED_FIELDS_PRESENT = "required_fields"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceScore:
-    """Detailed confidence score for an extraction."""
+    """Detailed confidence score for an extraction.
+
+    factor_values holds the factor scores in ConfidenceScorer.FACTOR_WEIGHTS
+    order; the factor_scores dict keyed by ConfidenceFactor is built from it
+    on first access.
+    """
 
     overall: float
     field_scores: dict[str, float] = field(default_factory=dict)
-    factor_scores: dict[ConfidenceFactor, float] = field(default_factory=dict)
-    explanation: str = ""
+    factor_values: tuple[float, ...] = ()
+    _factor_scores: dict[ConfidenceFactor, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _explanation: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Clamp overall score to valid range."""
-        self.overall = max(0.0, min(1.0, self.overall))
+        # Weighted factor scores are already in range; only clamp when not
+        if not 0.0 <= self.overall <= 1.0:
+            self.overall = max(0.0, min(1.0, self.overall))
+
+    @property
+    def factor_scores(self) -> dict[ConfidenceFactor, float]:
+        """Score of each confidence factor."""
+        if self._factor_scores is None:
+            self._factor_scores = dict(zip(ConfidenceScorer._FACTOR_ORDER, self.factor_values))
+        return self._factor_scores
+
+    @property
+    def explanation(self) -> str:
+        """Summary of the factors scoring below 0.7, built on first access."""
+        if self._explanation is None:
+            explanations = [
+                f"{factor.value}: {score:.0%}"
+                for factor, score in zip(ConfidenceScorer._FACTOR_ORDER, self.factor_values)
+                if score < 0.7
+            ]
+            self._explanation = (
+                f"Low scores: {', '.join(explanations)}" if explanations else "All factors good"
+            )
+        return self._explanation
 
 
 class ConfidenceScorer:
@@ -51,6 +83,11 @@ class ConfidenceScorer:
         ConfidenceFactor.CROSS_FIELD_CONSISTENCY: 0.10,
     }
 
+    # Factor order and weights as parallel tuples, in the order the factor
+    # scores are computed by score_extraction
+    _FACTOR_ORDER = tuple(FACTOR_WEIGHTS)
+    _WEIGHTS = tuple(FACTOR_WEIGHTS.values())
+
     def score_extraction(
         self,
         extraction: ExtractionResult,
@@ -65,125 +102,78 @@ class ConfidenceScorer:
         Returns:
             Detailed ConfidenceScore.
         """
-        factor_scores: dict[ConfidenceFactor, float] = {}
-
-        # Factor 1: Template match quality
-        factor_scores[ConfidenceFactor.TEMPLATE_MATCH_QUALITY] = (
-            extraction.template_confidence
-        )
-
-        # Factor 2: Required fields present
-        factor_scores[ConfidenceFactor.REQUIRED_FIELDS_PRESENT] = (
-            self._score_required_fields(extraction, template)
+        (
+            required_present,
+            extracted_count,
+            valid_count,
+            with_value_count,
+            field_scores,
+        ) = self._scan_fields(extraction, template)
+
+        required_total = len(template.required_field_names)
+        expected_total = len(template.field_names)
+
+        scores = (
+            # Factor 1: Template match quality
+            extraction.template_confidence,
+            # Factor 2: Required fields present
+            required_present / required_total if required_total else 1.0,
+            # Factor 3: Field completeness
+            extracted_count / expected_total if expected_total else 1.0,
+            # Factor 4: Format validity
+            valid_count / with_value_count if with_value_count else 1.0,
+            # Factor 5: Cross-field consistency
+            self._score_consistency(extraction),
         )
-
-        # Factor 3: Field completeness
-        factor_scores[ConfidenceFactor.FIELD_COMPLETENESS] = (
-            self._score_completeness(extraction, template)
-        )
-
-        # Factor 4: Format validity
-        factor_scores[ConfidenceFactor.FORMAT_VALIDITY] = (
-            self._score_format_validity(extraction)
-        )
-
-        # Factor 5: Cross-field consistency
-        factor_scores[ConfidenceFactor.CROSS_FIELD_CONSISTENCY] = (
-            self._score_consistency(extraction)
-        )
-
         # Calculate weighted overall score
-        overall = sum(
-            factor_scores[factor] * weight
-            for factor, weight in self.FACTOR_WEIGHTS.items()
-        )
-
-        # Build explanation
-        explanations = []
-        for factor, score in factor_scores.items():
-            if score < 0.7:
-                explanations.append(f"{factor.value}: {score:.0%}")
-
-        explanation = (
-            f"Low scores: {', '.join(explanations)}" if explanations else "All factors good"
-        )
-
-        # Collect individual field confidence scores
-        field_scores = {
-            name: field.confidence
-            for name, field in extraction.fields.items()
-            if field.has_value
-        }
+        overall = sum(map(mul, scores, self._WEIGHTS))
 
         return ConfidenceScore(
             overall=overall,
             field_scores=field_scores,
-            factor_scores=factor_scores,
-            explanation=explanation,
+            factor_values=scores,
         )
 
-    def _score_required_fields(
-        self,
-        extraction: ExtractionResult,
-        template: Template,
-    ) -> float:
-        """Score based on presence of required fields."""
-        required_fields = [f for f in template.extraction.fields if f.required]
-
-        if not required_fields:
-            return 1.0  # No required fields = perfect score
-
-        present_count = 0
-        for field_def in required_fields:
-            field = extraction.fields.get(field_def.name)
-            if field and field.has_value and field.confidence >= 0.5:
-                present_count += 1
-
-        return present_count / len(required_fields)
-
-    def _score_completeness(
+    def _scan_fields(
         self,
         extraction: ExtractionResult,
         template: Template,
-    ) -> float:
-        """Score based on percentage of fields extracted."""
-        expected_fields = [f.name for f in template.extraction.fields]
-
-        if not expected_fields:
-            return 1.0
-
-        extracted_count = sum(
-            1 for name in expected_fields
-            if name in extraction.fields and extraction.fields[name].has_value
-        )
-
-        return extracted_count / len(expected_fields)
-
-    def _score_format_validity(self, extraction: ExtractionResult) -> float:
-        """Score based on whether extracted values have valid formats."""
-        if not extraction.fields:
-            return 1.0
+    ) -> tuple[int, int, float, int, dict[str, float]]:
+        """Collect the per-field counters for scoring in one pass.
 
-        valid_count = 0
-        total_count = 0
-
-        for field in extraction.fields.values():
-            if not field.has_value:
-                continue
-
-            total_count += 1
-
-            # Check if normalization succeeded
+        Returns:
+            Tuple of (required fields present with confidence >= 0.5,
+            template fields extracted, format-valid count, fields with a
+            value, confidence of each field with a value).
+        """
+        field_index = template.field_index
+        required_present = 0
+        extracted_count = 0
+        normalized_count = 0
+        raw_only_count = 0
+        field_scores: dict[str, float] = {}
+
+        for name, field in extraction.fields.items():
             if field.normalized_value is not None:
-                valid_count += 1
+                normalized_count += 1
             elif field.raw_value is not None:
-                # Raw value exists but couldn't normalize - still partially valid
-                valid_count += 0.5
+                raw_only_count += 1
+            else:
+                continue
 
-        if total_count == 0:
-            return 1.0
+            field_scores[name] = confidence = field.confidence
+
+            required = field_index.get(name)
+            if required is None:
+                continue
+            extracted_count += 1
+            if required and confidence >= 0.5:
+                required_present += 1
 
-        return valid_count / total_count
+        # Raw values that couldn't be normalized are still partially valid
+        valid_count = normalized_count + 0.5 * raw_only_count
+        with_value_count = normalized_count + raw_only_count
+        return required_present, extracted_count, valid_count, with_value_count, field_scores
 
     def _score_consistency(self, extraction: ExtractionResult) -> float:
         """Score based on cross-field consistency checks.
@@ -192,12 +182,14 @@ class ConfidenceScorer:
         - total_gross should >= total_net
         - due_date should be after issue_date
         """
+        fields = extraction.fields
         checks_passed = 0
         checks_total = 0
 
-        # Check: gross >= net (if both present)
-        gross = extraction.get_field("total_gross")
-        net = extraction.get_field("total_net")
+        # Check: gross >= net (if both present); the second field is only
+        # looked up when the first exists
+        gross = fields.get("total_gross")
+        net = fields.get("total_net") if gross else None
         if gross and net and gross.has_value and net.has_value:
             checks_total += 1
             try:
@@ -209,8 +201,8 @@ class ConfidenceScorer:
                 pass
 
         # Check: due_date > issue_date (if both present)
-        issue = extraction.get_field("issue_date")
-        due = extraction.get_field("due_date")
+        issue = fields.get("issue_date")
+        due = fields.get("due_date") if issue else None
         if issue and due and issue.has_value and due.has_value:
             checks_total += 1
             issue_val = issue.normalized_value or issue.raw_value
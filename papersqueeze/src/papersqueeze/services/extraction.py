@@ -1,7 +1,7 @@
 """Extraction service - convenience wrapper around Claude client."""
 
 from papersqueeze.api.claude import ClaudeClient
-from papersqueeze.config.schema import TemplatesConfig
+from papersqueeze.config.schema import Template, TemplatesConfig
 from papersqueeze.models.extraction import ClassificationResult, ExtractionResult
 
 
@@ -22,6 +22,9 @@ class ExtractionService:
         self.claude = claude
         self.templates = templates
 
+        # Template resolved for each requested ID, fallback included
+        self._resolved_templates: dict[str, Template] = {}
+
     def classify(self, content: str) -> ClassificationResult:
         """Classify a document to determine its type.
 
@@ -43,18 +46,28 @@ class ExtractionService:
         Returns:
             ExtractionResult with extracted fields.
         """
-        template = self.templates.get_template_by_id(template_id)
-        if not template:
-            template = self.templates.get_template_by_id("fallback_general")
-            if not template:
-                raise ValueError(f"Template not found: {template_id}")
-
         return self.claude.extract_metadata(
             content=content,
-            template=template,
+            template=self._resolve_template(template_id),
             base_specialist_prompt=self.templates.base_prompts.specialist,
         )
 
+    def _resolve_template(self, template_id: str) -> Template:
+        """Get the template for an ID, falling back to fallback_general.
+
+        Raises:
+            ValueError: If neither the template nor the fallback exists.
+        """
+        template = self._resolved_templates.get(template_id)
+        if template is None:
+            template = self.templates.get_template_by_id(template_id)
+            if not template:
+                template = self.templates.get_template_by_id("fallback_general")
+                if not template:
+                    raise ValueError(f"Template not found: {template_id}")
+            self._resolved_templates[template_id] = template
+        return template
+
     def classify_and_extract(
         self, content: str
     ) -> tuple[ClassificationResult, ExtractionResult]:
@@ -9,7 +9,11 @@ import structlog
 from papersqueeze.models.document import Document
 from papersqueeze.models.extraction import ExtractionResult, ProposedChange
 from papersqueeze.services.confidence import ConfidenceScore
-from papersqueeze.utils.normalization import is_empty_value, values_match
+from papersqueeze.utils.normalization import (
+    is_empty_value,
+    present_values_match,
+    values_match,
+)
 
 logger = structlog.get_logger()
 
@@ -23,7 +27,7 @@ class MergeDecision(str, Enum):
     SKIP = "skip"                    # Skip this field (no value from either)
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldMergeResult:
     """Result of merging a single field."""
 
@@ -38,15 +42,27 @@ class FieldMergeResult:
     @property
     def is_change(self) -> bool:
         """Check if this results in a change."""
-        return self.decision in (MergeDecision.USE_AI, MergeDecision.NEEDS_REVIEW)
+        decision = self.decision
+        return decision is MergeDecision.USE_AI or decision is MergeDecision.NEEDS_REVIEW
 
     @property
     def is_auto_apply(self) -> bool:
         """Check if this can be auto-applied."""
-        return self.decision == MergeDecision.USE_AI
+        return self.decision is MergeDecision.USE_AI
+
+    def to_proposed_change(self) -> ProposedChange:
+        """Build the AI change this result proposes for the field."""
+        return ProposedChange(
+            self.field_name,
+            self.existing_value,
+            self.ai_value,
+            self.ai_confidence,
+            "ai",
+            self.reason,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of merging all fields."""
 
@@ -111,31 +127,24 @@ class MergeStrategy:
         """
         log = logger.bind(field=field_name)
 
+        def result(decision: MergeDecision, final_value: Any, reason: str) -> FieldMergeResult:
+            return FieldMergeResult(
+                field_name, existing_value, ai_value, ai_confidence, decision, final_value, reason
+            )
+
         existing_empty = is_empty_value(existing_value)
         ai_empty = is_empty_value(ai_value)
 
         # Case 1: Neither has a value
         if existing_empty and ai_empty:
-            return FieldMergeResult(
-                field_name=field_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-                decision=MergeDecision.SKIP,
-                final_value=None,
-                reason="No value from either source",
-            )
+            return result(MergeDecision.SKIP, None, "No value from either source")
 
         # Case 2: Only existing has value (AI didn't extract)
         if not existing_empty and ai_empty:
-            return FieldMergeResult(
-                field_name=field_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-                decision=MergeDecision.KEEP_EXISTING,
-                final_value=existing_value,
-                reason="AI did not extract this field",
+            return result(
+                MergeDecision.KEEP_EXISTING,
+                existing_value,
+                "AI did not extract this field",
             )
 
         # Case 3: Only AI has value (existing is empty) - FILL
@@ -146,14 +155,10 @@ class MergeStrategy:
                     value=ai_value,
                     confidence=ai_confidence,
                 )
-                return FieldMergeResult(
-                    field_name=field_name,
-                    existing_value=existing_value,
-                    ai_value=ai_value,
-                    ai_confidence=ai_confidence,
-                    decision=MergeDecision.USE_AI,
-                    final_value=ai_value,
-                    reason=f"Filling empty field (confidence: {ai_confidence:.0%})",
+                return result(
+                    MergeDecision.USE_AI,
+                    ai_value,
+                    f"Filling empty field (confidence: {ai_confidence:.0%})",
                 )
             else:
                 log.debug(
@@ -161,26 +166,18 @@ class MergeStrategy:
                     value=ai_value,
                     confidence=ai_confidence,
                 )
-                return FieldMergeResult(
-                    field_name=field_name,
-                    existing_value=existing_value,
-                    ai_value=ai_value,
-                    ai_confidence=ai_confidence,
-                    decision=MergeDecision.NEEDS_REVIEW,
-                    final_value=existing_value,
-                    reason=f"Low confidence ({ai_confidence:.0%}), needs review",
+                return result(
+                    MergeDecision.NEEDS_REVIEW,
+                    existing_value,
+                    f"Low confidence ({ai_confidence:.0%}), needs review",
                 )
 
         # Case 4: Both have values - compare
-        if values_match(existing_value, ai_value):
-            return FieldMergeResult(
-                field_name=field_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-                decision=MergeDecision.KEEP_EXISTING,
-                final_value=existing_value,
-                reason="AI agrees with existing value",
+        if present_values_match(existing_value, ai_value):
+            return result(
+                MergeDecision.KEEP_EXISTING,
+                existing_value,
+                "AI agrees with existing value",
             )
 
         # Values differ - AI wants to change
@@ -191,14 +188,10 @@ class MergeStrategy:
                 proposed=ai_value,
                 confidence=ai_confidence,
             )
-            return FieldMergeResult(
-                field_name=field_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-                decision=MergeDecision.NEEDS_REVIEW,
-                final_value=existing_value,  # Don't change yet
-                reason=f"AI suggests different value (confidence: {ai_confidence:.0%})",
+            return result(
+                MergeDecision.NEEDS_REVIEW,
+                existing_value,  # Don't change yet
+                f"AI suggests different value (confidence: {ai_confidence:.0%})",
             )
         else:
             log.debug(
@@ -207,14 +200,10 @@ class MergeStrategy:
                 proposed=ai_value,
                 confidence=ai_confidence,
             )
-            return FieldMergeResult(
-                field_name=field_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-                decision=MergeDecision.KEEP_EXISTING,
-                final_value=existing_value,
-                reason=f"AI confidence too low to suggest change ({ai_confidence:.0%})",
+            return result(
+                MergeDecision.KEEP_EXISTING,
+                existing_value,
+                f"AI confidence too low to suggest change ({ai_confidence:.0%})",
             )
 
     def merge_document(
@@ -243,51 +232,34 @@ class MergeStrategy:
         review_changes: list[ProposedChange] = []
         kept_existing: list[str] = []
 
+        # Loop invariants, looked up once per document rather than per field
+        ai_fields = extraction.fields
+        get_existing_value = document.get_custom_field_value
+        merge_field = self.merge_field
+
         for extracted_name, paperless_name in field_mapping.items():
             # Get AI value
-            ai_field = extraction.fields.get(extracted_name)
+            ai_field = ai_fields.get(extracted_name)
             if not ai_field:
                 continue
 
             ai_value = ai_field.normalized_value or ai_field.raw_value
             ai_confidence = ai_field.confidence
 
-            # Get existing value from document
-            existing_value = document.get_custom_field_value(paperless_name)
+            # Get existing value from document (a dict lookup on its name index)
+            existing_value = get_existing_value(paperless_name)
 
             # Merge
-            result = self.merge_field(
-                field_name=paperless_name,
-                existing_value=existing_value,
-                ai_value=ai_value,
-                ai_confidence=ai_confidence,
-            )
+            result = merge_field(paperless_name, existing_value, ai_value, ai_confidence)
             field_results.append(result)
 
-            # Categorize result
-            if result.decision == MergeDecision.USE_AI:
-                auto_apply_changes.append(
-                    ProposedChange(
-                        field_name=paperless_name,
-                        current_value=existing_value,
-                        proposed_value=ai_value,
-                        confidence=ai_confidence,
-                        source="ai",
-                        reason=result.reason,
-                    )
-                )
-            elif result.decision == MergeDecision.NEEDS_REVIEW:
-                review_changes.append(
-                    ProposedChange(
-                        field_name=paperless_name,
-                        current_value=existing_value,
-                        proposed_value=ai_value,
-                        confidence=ai_confidence,
-                        source="ai",
-                        reason=result.reason,
-                    )
-                )
-            elif result.decision == MergeDecision.KEEP_EXISTING:
+            # Categorize result (enum members are singletons)
+            decision = result.decision
+            if decision is MergeDecision.USE_AI:
+                auto_apply_changes.append(result.to_proposed_change())
+            elif decision is MergeDecision.NEEDS_REVIEW:
+                review_changes.append(result.to_proposed_change())
+            elif decision is MergeDecision.KEEP_EXISTING:
                 kept_existing.append(paperless_name)
 
         log.info(
@@ -324,10 +296,9 @@ class MergeStrategy:
             FieldMergeResult for the title.
         """
         # Check if existing title looks like a default/auto-generated one
-        is_default_title = (
-            existing_title.lower().startswith("document")
-            or existing_title.lower().startswith("scan")
-            or len(existing_title) < 10
+        # The length test comes first so short titles are never lowercased
+        is_default_title = len(existing_title) < 10 or existing_title.lower().startswith(
+            ("document", "scan")
         )
 
         if is_default_title and confidence >= self.auto_apply_threshold:
@@ -1,6 +1,7 @@
 """Main document processing orchestrator."""
 
 import time
+from collections.abc import Mapping
 from typing import Any
 
 import structlog
@@ -11,14 +12,9 @@ from papersqueeze.config.schema import AppConfig, Template, TemplatesConfig
 from papersqueeze.exceptions import ProcessingError
 from papersqueeze.models.document import CustomFieldValue, Document, DocumentUpdate
 from papersqueeze.models.extraction import ProcessingResult, ProposedChange
+from papersqueeze.processors import PROCESSOR_REGISTRY
 from papersqueeze.processors.base import BaseProcessor
-from papersqueeze.processors.fines import FinesProcessor
 from papersqueeze.processors.general import GeneralProcessor
-from papersqueeze.processors.tax import TaxProcessor
-from papersqueeze.processors.utilities import (
-    UtilitiesEnergyProcessor,
-    UtilitiesWaterProcessor,
-)
 from papersqueeze.services.confidence import ConfidenceScorer
 from papersqueeze.services.merge import MergeStrategy
 from papersqueeze.services.review import ReviewQueue
@@ -40,13 +36,7 @@ class DocumentProcessor:
     """
 
     # Map template IDs to processor classes
-    PROCESSORS: dict[str, type[BaseProcessor]] = {
-        "utilities_energy": UtilitiesEnergyProcessor,
-        "utilities_water": UtilitiesWaterProcessor,
-        "tax_at_guides": TaxProcessor,
-        "law_enforcement_fines": FinesProcessor,
-        "fallback_general": GeneralProcessor,
-    }
+    PROCESSORS: Mapping[str, type[BaseProcessor]] = PROCESSOR_REGISTRY
 
     def __init__(
         self,
@@ -17,6 +17,10 @@ DEFAULT_COL_WIDTHS = {
 }
 
 
+# Placeholder left in a title when its field had no value
+EMPTY_PLACEHOLDER_PATTERN = re.compile(r"\{\w+\}")
+
+
 class SafeDict(dict):
     """Dictionary that returns placeholder for missing keys in format strings."""
 
@@ -66,7 +70,7 @@ def format_ledger_title(
     result = " ".join(result.split())
 
     # Replace empty placeholders with dashes
-    result = re.sub(r"\{\w+\}", "-", result)
+    result = EMPTY_PLACEHOLDER_PATTERN.sub("-", result)
 
     return result
 
@@ -352,11 +352,34 @@ def values_match(value1: Any, value2: Any, normalize: bool = True) -> bool:
     Returns:
         True if values are equivalent.
     """
-    if is_empty_value(value1) and is_empty_value(value2):
+    # Identical values (the common "AI agrees" case) need no normalization
+    if value1 == value2:
         return True
 
-    if is_empty_value(value1) or is_empty_value(value2):
-        return False
+    empty1 = is_empty_value(value1)
+    empty2 = is_empty_value(value2)
+    if empty1 or empty2:
+        return empty1 and empty2
+
+    return present_values_match(value1, value2, normalize)
+
+
+def present_values_match(value1: Any, value2: Any, normalize: bool = True) -> bool:
+    """Check if two values, both known to be non-empty, are equivalent.
+
+    Same comparison as values_match, for callers that have already checked
+    both values with is_empty_value.
+
+    Args:
+        value1: First value.
+        value2: Second value.
+        normalize: Whether to normalize values before comparing.
+
+    Returns:
+        True if values are equivalent.
+    """
+    if value1 == value2:
+        return True
 
     if normalize:
         # Try as amounts
@@ -0,0 +1,139 @@
+"""Precompiled patterns for locating key values in OCR text.
+
+These mirror the families used by analyze_inbox.py. Adjacent tokens use
+disjoint character classes and whitespace runs are capped, so matching stays
+linear on long, noisy OCR lines.
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+# Within a family the patterns are tried in order and the first one that
+# matches wins, even if a later pattern matches earlier in the text.
+
+# Invoice number patterns
+INVOICE_PATTERNS = (
+    re.compile(r"Fatura\s{1,3}(?:n[.º°]?\s{0,3})?([A-Z0-9.]+(?:[-/][A-Z0-9.]+)+)", re.IGNORECASE),
+    re.compile(r"Factura\s{1,3}n[.º°]?\s{0,3}([A-Z0-9./]+(?:[ \t][A-Z0-9./]+)*)", re.IGNORECASE),
+    re.compile(r"FT\s{1,3}([A-Z0-9./]+)", re.IGNORECASE),
+)
+
+# Total amount patterns
+TOTAL_PATTERNS = (
+    re.compile(
+        r"\bTotal[:\s]{1,3}(?:\(\s{0,3}EUR\s{0,3}\)|EUR)?\s{0,3}([0-9][0-9.,]*)", re.IGNORECASE
+    ),
+    re.compile(r"\bTotal\s{1,3}Documento[:\s]{1,3}([0-9][0-9.,]*)", re.IGNORECASE),
+)
+
+# Portuguese tax ID (NIF)
+NIF_PATTERNS = (
+    re.compile(r"(?:N\.?I\.?[FP]\.?|Contribuinte)[:\s]{0,3}(\d{9})", re.IGNORECASE),
+)
+
+# ISO-style date, labelled first
+DATE_PATTERNS = (
+    re.compile(r"Data[:\s]{1,3}(\d{4}[-/]\d{2}[-/]\d{2})"),
+    re.compile(r"(\d{4}[-/]\d{2}[-/]\d{2})"),
+)
+
+# Issue date: only a date labelled as such, never a due date or billing period
+ISSUE_DATE_PATTERNS = (
+    re.compile(
+        r"\bData(?:\s{1,3}de\s{1,3}emiss[ãa]o)?[:\s]{1,3}(\d{4}[-/]\d{2}[-/]\d{2})",
+        re.IGNORECASE,
+    ),
+)
+
+KEY_VALUE_FAMILIES = (INVOICE_PATTERNS, TOTAL_PATTERNS, NIF_PATTERNS, DATE_PATTERNS)
+
+# Template fields that can be read straight from OCR text. The NIF is left
+# out: documents carry both the issuer's and the customer's.
+FIELD_PATTERNS = {
+    "invoice_number": INVOICE_PATTERNS,
+    "total_gross": TOTAL_PATTERNS,
+    "issue_date": ISSUE_DATE_PATTERNS,
+}
+
+# Paragraphs are separated by one or more blank lines
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n")
+
+
+def search_family(patterns: tuple[re.Pattern[str], ...], content: str) -> str | None:
+    """Return the value captured by the first pattern that matches, if any."""
+    for pattern in patterns:
+        match = pattern.search(content)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def select_relevant_snippets(content: str, limit: int) -> str:
+    """Shrink content to at most limit characters, keeping the useful parts.
+
+    Content that already fits is returned unchanged. Otherwise the text is
+    split into paragraphs and each is scored by how many key-value pattern
+    families (invoice number, total, NIF, date) it matches. The first
+    paragraph (usually the issuer header) is always kept, then the best
+    scoring paragraphs are added while they fit, and any budget left is
+    filled with the remaining paragraphs in document order. The selection is
+    joined in original document order.
+
+    Args:
+        content: Document OCR text.
+        limit: Maximum number of characters to return.
+
+    Returns:
+        Selected paragraphs, or a plain truncation when nothing matches.
+    """
+    if len(content) <= limit:
+        return content
+
+    paragraphs = [p for p in PARAGRAPH_SPLIT_PATTERN.split(content) if p.strip()]
+    scores = [
+        sum(1 for family in KEY_VALUE_FAMILIES if any(pattern.search(p) for pattern in family))
+        for p in paragraphs
+    ]
+    if not any(scores):
+        return content[:limit]
+
+    selected = {0}
+    used = len(paragraphs[0])
+    # Stable sort: unscored paragraphs follow in document order
+    ranked = sorted(range(1, len(paragraphs)), key=lambda i: -scores[i])
+    for i in ranked:
+        size = len(paragraphs[i]) + 2  # joining blank line
+        if used + size <= limit:
+            selected.add(i)
+            used += size
+
+    result = "\n\n".join(paragraphs[i] for i in sorted(selected))
+    return result[:limit]
+
+
+def extract_missing_fields(
+    content: str, fields: dict[str, Any], field_names: Iterable[str]
+) -> dict[str, str]:
+    """Extract the fields a model response left empty from OCR text.
+
+    Fields the model filled are never looked at, so a local match can only
+    add a value, not replace one.
+
+    Args:
+        content: Document OCR text.
+        fields: Field values from the model response.
+        field_names: Template field names to look for.
+
+    Returns:
+        Map of field name to raw matched value, for empty fields that matched.
+    """
+    values: dict[str, str] = {}
+    for name in field_names:
+        if fields.get(name) not in (None, ""):
+            continue
+        patterns = FIELD_PATTERNS.get(name)
+        value = search_family(patterns, content) if patterns else None
+        if value:
+            values[name] = value
+    return values
@@ -0,0 +1,54 @@
+"""Tests for the inbox analysis script."""
+
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parents[2] / "analyze_inbox.py"
+
+
+@pytest.fixture(scope="module")
+def extract_values():
+    spec = importlib.util.spec_from_file_location("analyze_inbox", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.extract_values
+
+
+class TestExtractValues:
+    """Tests for pattern priority within each family."""
+
+    def test_earlier_pattern_wins_over_earlier_match(self, extract_values) -> None:
+        content = (
+            "FT 77 Data de vencimento 2025-03-31\n"
+            "Total Documento: 50,00\n"
+            "Fatura nº FT2025/123  Data: 2025-03-01\n"
+            "Total: 40,65\n"
+        )
+
+        assert extract_values(content) == {
+            "invoice_number": "FT2025/123",
+            "total": "40,65",
+            "date": "2025-03-01",
+        }
+
+    def test_falls_back_to_later_patterns(self, extract_values) -> None:
+        content = "FT 77 emitida 2025-03-31\nTotal Documento: 50,00"
+
+        assert extract_values(content) == {
+            "invoice_number": "77",
+            "total": "50,00",
+            "date": "2025-03-31",
+        }
+
+    def test_long_factura_line_is_linear(self, extract_values) -> None:
+        number = " ".join(["A1/2"] * 2000)
+        content = f"Factura n {number}\nTotal " + " \t" * 5000 + "x\n" + "ft " * 3000
+
+        start = time.perf_counter()
+        result = extract_values(content)
+
+        assert time.perf_counter() - start < 1.0
+        assert result == {"invoice_number": number}
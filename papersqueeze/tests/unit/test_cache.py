@@ -0,0 +1,29 @@
+"""Tests for the in-memory caches."""
+
+from papersqueeze.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for size-bounded caching."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1
+
+        cache["c"] = 3
+
+        assert list(cache) == ["a", "c"]
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_overwrite_does_not_grow(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+
+        cache["c"] = 3
+
+        assert dict(cache) == {"a": 10, "c": 3}
@@ -0,0 +1,51 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+from datetime import UTC, date, datetime
+
+import pytest
+
+
+def test_help_skips_heavy_imports() -> None:
+    """`papersqueeze --help` must not load the HTTP client or pydantic."""
+    code = (
+        "import sys; sys.argv = ['papersqueeze', '--help']\n"
+        "from papersqueeze.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('httpx', 'pydantic', 'yaml') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_parser_only_defines_selected_subcommand_arguments() -> None:
+    from papersqueeze.cli import _build_parser
+
+    args = _build_parser("snapshot").parse_args(["snapshot", "5", "--json"])
+    assert (args.command, args.doc_id, args.json) == ("snapshot", 5, True)
+
+    args = _build_parser("info").parse_args(["info"])
+    assert args.command == "info"
+    assert not hasattr(args, "doc_id")
+
+
+def test_format_json_matches_standard_library() -> None:
+    pytest.importorskip("orjson")
+    from papersqueeze import cli
+
+    data = {
+        "title": "Fatura nº 1 — Águas",
+        "created": date(2024, 3, 1),
+        "added": datetime(2024, 3, 2, 10, 0, tzinfo=UTC),
+        "custom_fields": {7: "12.50"},
+    }
+
+    assert cli.format_json(data) == cli._json_dumps(data)
+    assert "Águas" in cli.format_json(data)
@@ -163,6 +163,71 @@ class TestConfidenceScorer:
         # Format validity should be low (raw values exist but no normalization)
         assert score.factor_scores[ConfidenceFactor.FORMAT_VALIDITY] == 0.5
 
+    def test_overall_is_weighted_sum_of_factors(
+        self,
+        scorer: ConfidenceScorer,
+        template_with_required_fields: Template,
+    ) -> None:
+        """Each factor score should be paired with its own weight."""
+        extraction = ExtractionResult(
+            template_id="test",
+            template_confidence=0.6,
+            fields={
+                "issue_date": ExtractedField(
+                    name="issue_date",
+                    raw_value="2025-01-15",
+                    normalized_value="2025-01-15",
+                    confidence=0.9,
+                    field_type=FieldType.DATE,
+                ),
+            },
+        )
+
+        score = scorer.score_extraction(extraction, template_with_required_fields)
+
+        assert list(score.factor_scores) == list(ConfidenceScorer.FACTOR_WEIGHTS)
+        expected = sum(
+            score.factor_scores[factor] * weight
+            for factor, weight in ConfidenceScorer.FACTOR_WEIGHTS.items()
+        )
+        assert score.overall == pytest.approx(expected)
+
+    def test_consistency_checks(self, scorer: ConfidenceScorer) -> None:
+        """Gross below net fails; a due date after the issue date passes."""
+
+        def field(name: str, value: str) -> ExtractedField:
+            return ExtractedField(name=name, raw_value=value, normalized_value=value)
+
+        extraction = ExtractionResult(
+            template_id="test",
+            template_confidence=0.9,
+            fields={
+                "total_gross": field("total_gross", "10.00"),
+                "total_net": field("total_net", "12.00"),
+                "issue_date": field("issue_date", "2025-01-15"),
+                "due_date": field("due_date", "2025-02-15"),
+            },
+        )
+
+        assert scorer._score_consistency(extraction) == 0.5
+
+        del extraction.fields["total_net"]
+        assert scorer._score_consistency(extraction) == 1.0
+
+    def test_explanation_lists_low_factors(
+        self,
+        scorer: ConfidenceScorer,
+        template_with_required_fields: Template,
+    ) -> None:
+        """Factors scoring below 0.7 should be named in the explanation."""
+        extraction = ExtractionResult(template_id="test", template_confidence=0.5, fields={})
+
+        score = scorer.score_extraction(extraction, template_with_required_fields)
+
+        assert score.explanation == (
+            "Low scores: template_match: 50%, required_fields: 0%, completeness: 0%"
+        )
+
     def test_is_confident_for_auto_apply(self, scorer: ConfidenceScorer) -> None:
         """Test auto-apply threshold checking."""
         from papersqueeze.services.confidence import ConfidenceScore
@@ -195,3 +260,26 @@ class TestConfidenceScore:
 
         score = ConfidenceScore(overall=-0.5)
         assert score.overall == 0.0
+
+    def test_explanation_without_low_factors(self) -> None:
+        from papersqueeze.services.confidence import ConfidenceScore
+
+        score = ConfidenceScore(overall=0.9, factor_values=(0.9, 1.0, 0.8, 0.9, 1.0))
+        assert score.explanation == "All factors good"
+
+    def test_factor_scores_keyed_by_factor(self) -> None:
+        from papersqueeze.services.confidence import ConfidenceScore
+
+        score = ConfidenceScore(overall=0.5, factor_values=(0.1, 0.2, 0.3, 0.4, 0.5))
+
+        assert score.factor_scores == {
+            ConfidenceFactor.TEMPLATE_MATCH_QUALITY: 0.1,
+            ConfidenceFactor.REQUIRED_FIELDS_PRESENT: 0.2,
+            ConfidenceFactor.FIELD_COMPLETENESS: 0.3,
+            ConfidenceFactor.FORMAT_VALIDITY: 0.4,
+            ConfidenceFactor.CROSS_FIELD_CONSISTENCY: 0.5,
+        }
+        assert score.explanation == (
+            "Low scores: template_match: 10%, required_fields: 20%, "
+            "completeness: 30%, format_valid: 40%, consistency: 50%"
+        )
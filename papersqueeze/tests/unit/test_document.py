@@ -0,0 +1,63 @@
+"""Tests for document models."""
+
+from papersqueeze.models.document import CustomFieldValue, Document, DocumentUpdate
+
+
+class TestDocument:
+    """Tests for Document lookups."""
+
+    def test_has_tag_is_case_insensitive(self) -> None:
+        doc = Document(id=1, title="Doc", tags=[3, 5], tag_names=["Inbox", "EDP"])
+
+        assert doc.has_tag("inbox")
+        assert doc.has_tag("edp")
+        assert not doc.has_tag("review")
+
+    def test_has_tag_id(self) -> None:
+        doc = Document(id=1, title="Doc", tags=[3, 5])
+
+        assert doc.has_tag_id(5)
+        assert not doc.has_tag_id(4)
+
+    def test_custom_field_lookups(self) -> None:
+        doc = Document(
+            id=1,
+            title="Doc",
+            custom_fields=[
+                CustomFieldValue(field=7, field_name="total_gross", value="12.30"),
+                CustomFieldValue(field=8, value="unnamed"),
+                CustomFieldValue(field=9, field_name="total_gross", value="99.00"),
+            ],
+        )
+
+        assert doc.get_custom_field_value("total_gross") == "12.30"
+        assert doc.get_custom_field_value("missing") is None
+        assert doc.get_custom_field_by_id(8) == "unnamed"
+        assert doc.get_custom_field_by_id(10) is None
+
+
+class TestDocumentUpdate:
+    """Tests for DocumentUpdate payloads."""
+
+    def test_payload_skips_unset_fields(self) -> None:
+        update = DocumentUpdate(
+            title="New",
+            created="2024-03-01",
+            tags=[1, 2],
+            custom_fields=[CustomFieldValue(field=7, value="x")],
+        )
+
+        assert update.to_api_payload() == {
+            "title": "New",
+            "created": "2024-03-01",
+            "tags": [1, 2],
+            "custom_fields": [{"field": 7, "value": "x"}],
+        }
+        assert not update.is_empty()
+
+    def test_empty_update(self) -> None:
+        update = DocumentUpdate()
+
+        assert update.to_api_payload() == {}
+        assert update.is_empty()
+        assert not DocumentUpdate(custom_fields=[]).is_empty()
@@ -0,0 +1,206 @@
+"""Tests for configuration loading."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from papersqueeze.config.loader import (
+    _find_config_file,
+    _load_yaml_cached,
+    _load_yaml_file,
+    _substitute_env_vars,
+    load_templates,
+)
+from papersqueeze.exceptions import ConfigurationError
+
+
+@pytest.fixture(autouse=True)
+def clear_yaml_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _load_yaml_cached.cache_clear()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+class TestLoadYamlFile:
+    """Tests for YAML file loading and caching."""
+
+    def test_parses_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        path.write_text("paperless:\n  url: http://x\n")
+
+        assert _load_yaml_file(path) == {"paperless": {"url": "http://x"}}
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        path.write_text("")
+
+        assert _load_yaml_file(path) == {}
+
+    def test_non_mapping_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        path.write_text("- a\n- b\n")
+
+        with pytest.raises(ConfigurationError, match="expected dict"):
+            _load_yaml_file(path)
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        path.write_text("a: 1\n")
+
+        first = _load_yaml_file(path)
+        first["a"] = 2
+        second = _load_yaml_file(path)
+
+        assert second == {"a": 1}
+        assert _load_yaml_cached.cache_info().hits == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.yaml"
+        path.write_text("a: 1\n")
+        _load_yaml_file(path)
+
+        path.write_text("a: 22\n")
+        os.utime(path, ns=(0, 10**9))
+
+        assert _load_yaml_file(path) == {"a": 22}
+
+
+class TestSubstituteEnvVars:
+    """Tests for environment variable substitution."""
+
+    def test_substitutes_nested_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PS_TOKEN", "secret")
+
+        result = _substitute_env_vars(
+            {"token": "${PS_TOKEN}", "items": ["x-${PS_MISSING:def}", 3], "plain": "a$b"}
+        )
+
+        assert result == {"token": "secret", "items": ["x-def", 3], "plain": "a$b"}
+
+    def test_missing_required_variable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PS_MISSING", raising=False)
+
+        with pytest.raises(ConfigurationError, match="PS_MISSING"):
+            _substitute_env_vars({"token": "${PS_MISSING}"})
+
+
+def test_import_is_lazy() -> None:
+    """Importing the config package must not pull in yaml or pydantic."""
+    code = (
+        "import sys, papersqueeze.config; "
+        "print('yaml' in sys.modules, 'pydantic' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+TEMPLATES_YAML = """\
+defaults:
+  timeout_ms: 30000
+
+templates:
+  # Energy
+  - id: "energy"
+    description: "Electricity"
+    extraction:
+      rules: |
+        1. Find the total
+      fields:
+        - name: total_amount
+          required: true
+    field_mapping:
+      total_amount: amt_primary
+
+  - id: water
+    description: Water
+    tags_add: ["${WATER_TAG:agua}"]
+
+base_prompts:
+  gatekeeper: classify
+"""
+
+
+class TestLoadTemplates:
+    """Tests for templates file loading."""
+
+    def test_validation_errors_are_listed(self, tmp_path: Path) -> None:
+        path = tmp_path / "templates.yaml"
+        path.write_text("templates:\n  - id: a\n  - description: b\n")
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            load_templates(path)
+
+        assert str(exc_info.value) == (
+            f"Templates validation failed for {path}:\n"
+            "  - templates.0.description: Field required\n"
+            "  - templates.1.id: Field required"
+        )
+
+    def test_fast_validate_reuses_pickled_result(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("PAPERSQUEEZE_FAST_VALIDATE", "1")
+        monkeypatch.setenv("WATER_TAG", "agua")
+        path = tmp_path / "templates.yaml"
+        path.write_text(TEMPLATES_YAML)
+
+        first = load_templates(path)
+        _load_yaml_cached.cache_clear()
+        second = load_templates(path)
+
+        assert second == first
+        assert second.get_template_by_id("water") is second.templates[1]
+        assert _load_yaml_cached.cache_info().misses == 0
+        assert len(list((tmp_path / "cache" / "papersqueeze").glob("*.pkl"))) == 1
+
+        # Unpickled names are interned again, as validation interns them
+        energy = second.templates[0]
+        assert energy.required_field_names[0] is sys.intern("total_amount")
+        assert next(iter(energy.field_mapping)) is sys.intern("total_amount")
+        assert energy.field_mapping["total_amount"] is sys.intern("amt_primary")
+
+        # A referenced environment variable changing invalidates the cache
+        monkeypatch.setenv("WATER_TAG", "water")
+        assert load_templates(path).templates[1].tags_add == ["water"]
+
+    def test_nothing_cached_without_opt_in(self, tmp_path: Path) -> None:
+        path = tmp_path / "templates.yaml"
+        path.write_text(TEMPLATES_YAML)
+
+        assert load_templates(path).get_template_by_id("energy") is not None
+        assert not (tmp_path / "cache").exists()
+
+
+class TestFindConfigFile:
+    """Tests for config file discovery."""
+
+    def test_env_var_overrides_defaults(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "custom.yaml"
+        path.write_text("a: 1\n")
+        monkeypatch.setenv("PS_TEST_CONFIG", str(path))
+
+        found = _find_config_file(None, [tmp_path / "missing.yaml"], "Test", "PS_TEST_CONFIG")
+
+        assert found == path
+
+    def test_first_existing_default(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("PS_TEST_CONFIG", raising=False)
+        (tmp_path / "second.yaml").write_text("a: 1\n")
+        defaults = [tmp_path / "first.yaml", tmp_path / "second.yaml"]
+
+        assert _find_config_file(None, defaults, "Test", "PS_TEST_CONFIG") == defaults[1]
+
+    def test_nothing_found(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PS_TEST_CONFIG", raising=False)
+
+        with pytest.raises(ConfigurationError, match="set PS_TEST_CONFIG"):
+            _find_config_file(None, [tmp_path / "none.yaml"], "Test", "PS_TEST_CONFIG")
@@ -2,6 +2,9 @@
 
 import pytest
 
+from papersqueeze.models.document import CustomFieldValue, Document
+from papersqueeze.models.extraction import ExtractedField, ExtractionResult
+from papersqueeze.services.confidence import ConfidenceScore
 from papersqueeze.services.merge import MergeDecision, MergeStrategy
 
 
@@ -123,6 +126,55 @@ class TestMergeField:
         assert result.decision == MergeDecision.USE_AI
 
 
+class TestMergeDocument:
+    """Tests for merging a whole extraction."""
+
+    def test_categorizes_fields(self) -> None:
+        document = Document(
+            id=1,
+            title="Doc",
+            custom_fields=[
+                CustomFieldValue(field=1, field_name="Total", value="10.00"),
+                CustomFieldValue(field=2, field_name="NIF", value="123456789"),
+            ],
+        )
+        extraction = ExtractionResult(
+            template_id="test",
+            template_confidence=0.9,
+            fields={
+                "total_gross": ExtractedField(
+                    name="total_gross", raw_value="10.00", confidence=0.9
+                ),
+                "nif": ExtractedField(name="nif", raw_value="987654321", confidence=0.95),
+                "issue_date": ExtractedField(
+                    name="issue_date",
+                    raw_value="15/01/2025",
+                    normalized_value="2025-01-15",
+                    confidence=0.8,
+                ),
+            },
+        )
+        field_mapping = {
+            "total_gross": "Total",
+            "nif": "NIF",
+            "issue_date": "Date",
+            "missing": "Missing",
+        }
+
+        result = MergeStrategy().merge_document(
+            document, extraction, field_mapping, ConfidenceScore(overall=0.9)
+        )
+
+        assert [r.field_name for r in result.field_results] == ["Total", "NIF", "Date"]
+        assert result.kept_existing == ["Total"]
+        assert [c.field_name for c in result.review_changes] == ["NIF"]
+        assert [c.field_name for c in result.auto_apply_changes] == ["Date"]
+        assert result.auto_apply_changes[0].proposed_value == "2025-01-15"
+        assert result.auto_apply_changes[0].current_value is None
+        assert result.review_changes[0].current_value == "123456789"
+        assert result.review_changes[0].reason == result.field_results[1].reason
+
+
 class TestMergeTitle:
     """Tests for title merging."""
 
@@ -194,9 +246,15 @@ class TestFieldMergeResult:
         )
         assert result.is_change is True
 
+        result.decision = MergeDecision.NEEDS_REVIEW
+        assert result.is_change is True
+
         result.decision = MergeDecision.KEEP_EXISTING
         assert result.is_change is False
 
+        result.decision = MergeDecision.SKIP
+        assert result.is_change is False
+
     def test_is_auto_apply(self) -> None:
         from papersqueeze.services.merge import FieldMergeResult
 
@@ -12,6 +12,7 @@ from papersqueeze.utils.normalization import (
     normalize_mb_reference,
     calculate_due_date,
     is_empty_value,
+    present_values_match,
     values_match,
 )
 
@@ -237,3 +238,16 @@ class TestValuesMatch:
     def test_different_values(self) -> None:
         assert values_match("123.45", "123.46") is False
         assert values_match("hello", "world") is False
+
+    def test_whitespace_and_none_are_both_empty(self) -> None:
+        assert values_match("   ", None) is True
+
+
+class TestPresentValuesMatch:
+    """Tests for matching values already known to be non-empty."""
+
+    def test_matches_like_values_match(self) -> None:
+        assert present_values_match("HELLO", "hello") is True
+        assert present_values_match("123,45", "123.45") is True
+        assert present_values_match("15/01/2025", "2025-01-15") is True
+        assert present_values_match("hello", "world") is False
@@ -0,0 +1,277 @@
+"""Tests for the Paperless-ngx API clients."""
+
+import dataclasses
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from papersqueeze.api import paperless
+from papersqueeze.api.paperless import DocumentPatch, PaperlessClient, _TTLCache
+from papersqueeze.config.schema import PaperlessConfig
+
+DOCUMENT = {
+    "id": 7,
+    "title": "Invoice",
+    "content": "Fatura FT 1/2",
+    "tags": [1, 2],
+    "correspondent": 3,
+    "document_type": 4,
+    "custom_fields": [{"field": 5, "value": "12.50"}],
+}
+
+METADATA = {
+    "/api/tags/": [{"id": 1, "name": "Inbox"}, {"id": 2, "name": "Energy"}],
+    "/api/correspondents/": [{"id": 3, "name": "EDP"}],
+    "/api/document_types/": [{"id": 4, "name": "Invoice"}],
+    "/api/custom_fields/": [{"id": 5, "name": "amt_primary", "data_type": "monetary"}],
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Serve a fixed document and its metadata list endpoints."""
+    path = request.url.path
+    if path.startswith("/api/documents/"):
+        document = {**DOCUMENT, "id": int(path.split("/")[3])}
+        if request.method == "PATCH":
+            document.update(json.loads(request.content))
+        if "fields" in request.url.params:
+            wanted = request.url.params["fields"].split(",")
+            document = {k: v for k, v in document.items() if k in wanted}
+        return httpx.Response(200, json=document)
+    if path in METADATA:
+        ids = request.url.params.get("id__in")
+        items = METADATA[path]
+        if ids:
+            wanted = {int(i) for i in ids.split(",")}
+            items = [item for item in items if item["id"] in wanted]
+        name = request.url.params.get("name__iexact")
+        if name:
+            items = [item for item in items if item["name"].lower() == name.lower()]
+        return httpx.Response(200, json={"results": items, "next": None})
+    return httpx.Response(404)
+
+
+def counting(requests: list[str]):
+    """Wrap the handler, recording each requested path."""
+
+    def wrapped(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return handler(request)
+
+    return wrapped
+
+
+def make_config(**overrides: object) -> PaperlessConfig:
+    return PaperlessConfig(url="http://paperless/api", token="t", **overrides)
+
+
+class TestPaperlessClient:
+    """Tests for the synchronous client."""
+
+    def test_get_document_snapshot(self) -> None:
+        requests: list[str] = []
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(counting(requests))
+        )
+
+        snapshot = client.get_document_snapshot(7)
+
+        assert snapshot.tag_names == ["Inbox", "Energy"]
+        assert snapshot.correspondent_name == "EDP"
+        assert snapshot.document_type_name == "Invoice"
+        assert snapshot.custom_fields == {"amt_primary": "12.50"}
+        assert client.get_custom_field_by_name("AMT_PRIMARY").data_type == "monetary"
+        assert snapshot.has_tag("inbox") and snapshot.has_tag_id(2)
+        assert not snapshot.has_tag("archive")
+        # One document GET plus one list request per metadata kind
+        assert len(requests) == 5
+
+        # Frozen, so the derived tag sets cannot go stale
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.tag_names = ["Archive"]  # type: ignore[misc]
+
+    def test_cached_names_skip_lookups(self) -> None:
+        requests: list[str] = []
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(counting(requests))
+        )
+
+        client.get_document_snapshot(7)
+        requests.clear()
+        client.get_document_snapshot(8)
+
+        assert requests == ["/api/documents/8/"]
+        assert client.cache_stats()["hits"] == 5
+        assert client.cache_stats()["misses"] == 5
+
+    def test_close_logs_hit_rate(self, caplog: pytest.LogCaptureFixture) -> None:
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        client.get_document_snapshot(7)
+        client.get_document_snapshot(8)
+
+        with caplog.at_level("DEBUG", logger=paperless.logger.name):
+            client.close()
+
+        assert "5 hits, 5 misses (50% hit rate)" in caplog.text
+
+    def test_patch_uses_response_body(self) -> None:
+        requests: list[str] = []
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(counting(requests))
+        )
+        client.preload_cache()
+        requests.clear()
+
+        snapshot = client.patch_document(7, DocumentPatch(title="Renamed"), current_tags=[1, 2])
+
+        assert snapshot.title == "Renamed"
+        assert snapshot.tag_names == ["Inbox", "Energy"]
+        assert requests == ["/api/documents/7/"]
+
+    def test_get_by_name(self) -> None:
+        requests: list[str] = []
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(counting(requests))
+        )
+
+        assert client.get_tag_id("energy") == 2
+        assert client.get_correspondent_by_name("edp").name == "EDP"
+        assert client.get_document_type_by_name("Receipt") is None
+        assert client.get_tag_by_name("ENERGY").name == "Energy"
+        assert len(requests) == 3
+
+    def test_metadata_only_snapshot(self) -> None:
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        snapshot = client.get_document_snapshot(7, include_content=False)
+
+        assert snapshot.title == "Invoice"
+        assert snapshot.tag_names == ["Inbox", "Energy"]
+        assert (snapshot.content, snapshot.content_hash, snapshot.content_length) == ("", "", 0)
+
+
+def paged_handler(request: httpx.Request) -> httpx.Response:
+    """Serve 5 tags two per page, ignoring page_size; other endpoints are empty."""
+    if request.url.path != "/api/tags/":
+        return httpx.Response(200, json={"count": 0, "results": [], "next": None})
+    tags = [{"id": i, "name": f"tag-{i}"} for i in range(1, 6)]
+    page = int(request.url.params.get("page", 1))
+    results = tags[(page - 1) * 2 : page * 2]
+    return httpx.Response(
+        200,
+        json={"count": len(tags), "results": results, "next": "more" if page < 3 else None},
+    )
+
+
+class TestPreloadCache:
+    """Tests for metadata preloading."""
+
+    def test_requests_large_pages(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def recording(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return paged_handler(request)
+
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(recording)
+        )
+
+        client.preload_cache()
+
+        assert {r.url.params["page_size"] for r in requests} == {"1000"}
+        # 4 first pages, then the 2 remaining tag pages
+        assert len(requests) == 6
+
+    def test_sync_loads_every_page(self) -> None:
+        client = PaperlessClient(make_config())
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(paged_handler)
+        )
+
+        client.preload_cache()
+
+        assert sorted(client._tag_id_cache) == [1, 2, 3, 4, 5]
+        assert client.get_tag_id("TAG-5") == 5
+
+    def test_cold_client_creates_one_http_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        created: list[httpx.Client] = []
+        real_client = httpx.Client
+
+        def make_client(**kwargs: Any) -> httpx.Client:
+            kwargs["transport"] = httpx.MockTransport(paged_handler)
+            created.append(real_client(**kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(paperless.httpx, "Client", make_client)
+        client = PaperlessClient(make_config())
+
+        client.preload_cache()
+
+        assert created == [client._client]
+
+
+class TestTTLCache:
+    """Tests for the expiring metadata cache."""
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr(paperless.time, "monotonic", lambda: now[0])
+        cache: _TTLCache[int, str] = _TTLCache(60)
+        cache[1] = "Inbox"
+
+        now[0] += 59
+        assert cache.get(1) == "Inbox"
+        assert 1 in cache
+
+        now[0] += 1
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_never_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [0.0]
+        monkeypatch.setattr(paperless.time, "monotonic", lambda: now[0])
+        cache: _TTLCache[int, str] = _TTLCache(0)
+        cache[1] = "Inbox"
+
+        now[0] += 10**9
+        assert cache[1] == "Inbox"
+        assert list(cache) == [1]
+
+
+class TestDocumentPatch:
+    """Tests for patch payload generation."""
+
+    def test_empty_patch(self) -> None:
+        assert DocumentPatch().to_api_payload([3, 1]) == {}
+
+    def test_tags_are_merged_and_sorted(self) -> None:
+        patch = DocumentPatch(tags_add=[5, 2], tags_remove=[3])
+
+        assert patch.to_api_payload([3, 1]) == {"tags": [1, 2, 5]}
+
+    def test_only_removed_tags(self) -> None:
+        patch = DocumentPatch(tags_remove=[1, 7])
+
+        assert patch.to_api_payload([1, 3]) == {"tags": [3]}
+
+    def test_fields_without_tag_changes(self) -> None:
+        patch = DocumentPatch(title="Invoice", custom_fields={4: "12.50"})
+
+        assert patch.to_api_payload([1]) == {
+            "title": "Invoice",
+            "custom_fields": [{"field": 4, "value": "12.50"}],
+        }
@@ -0,0 +1,96 @@
+"""Tests for OCR key-value patterns."""
+
+from papersqueeze.utils.patterns import (
+    INVOICE_PATTERNS,
+    NIF_PATTERNS,
+    TOTAL_PATTERNS,
+    extract_missing_fields,
+    search_family,
+    select_relevant_snippets,
+)
+
+
+class TestPatterns:
+    """Tests for the precompiled pattern families."""
+
+    def test_invoice_number(self) -> None:
+        assert search_family(INVOICE_PATTERNS, "Fatura n.º FT 2025/123") == "2025/123"
+
+    def test_factura_does_not_cross_lines(self) -> None:
+        assert search_family(INVOICE_PATTERNS, "Factura nº ABC 123\nTotal") == "ABC 123"
+
+    def test_earlier_pattern_wins_over_earlier_match(self) -> None:
+        content = "FT 77 recibo\nTotal Documento: 50,00\nFatura nº 2024/001\nTotal: 40,65"
+
+        assert search_family(INVOICE_PATTERNS, content) == "2024/001"
+        assert search_family(TOTAL_PATTERNS, content) == "40,65"
+
+    def test_total(self) -> None:
+        assert search_family(TOTAL_PATTERNS, "Total ( EUR ) 99,00") == "99,00"
+
+    def test_nif(self) -> None:
+        assert NIF_PATTERNS[0].findall("N.I.F. 500100200 Contribuinte: 123456789") == [
+            "500100200",
+            "123456789",
+        ]
+
+    def test_long_noisy_line_fails_fast(self) -> None:
+        assert search_family(TOTAL_PATTERNS, "Total " + " " * 50_000 + "x") is None
+
+
+class TestSelectRelevantSnippets:
+    """Tests for content shrinking before prompting."""
+
+    def test_short_content_unchanged(self) -> None:
+        content = "Header\n\nTotal: 10,00"
+        assert select_relevant_snippets(content, 1000) is content
+
+    def test_keeps_header_and_matching_paragraphs(self) -> None:
+        filler = "\n\n".join("lorem ipsum dolor sit amet " * 4 for _ in range(20))
+        content = f"ACME LDA\n\n{filler}\n\nTotal: 123,45\n\n{filler}\n\nNIF: 500100200"
+        result = select_relevant_snippets(content, 200)
+
+        assert result.startswith("ACME LDA")
+        assert "Total: 123,45" in result
+        assert "NIF: 500100200" in result
+        assert result.index("Total") < result.index("NIF")
+        assert len(result) <= 200
+
+    def test_leftover_budget_filled_in_document_order(self) -> None:
+        content = "ACME LDA\n\nfirst note\n\n" + "x" * 300 + "\n\nTotal: 9,99\n\nlast note"
+        result = select_relevant_snippets(content, 60)
+
+        assert result == "ACME LDA\n\nfirst note\n\nTotal: 9,99\n\nlast note"
+
+    def test_no_matches_falls_back_to_truncation(self) -> None:
+        content = "x" * 500
+        assert select_relevant_snippets(content, 100) == "x" * 100
+
+
+class TestExtractMissingFields:
+    """Tests for local field extraction."""
+
+    def test_extracts_only_requested_fields_with_patterns(self) -> None:
+        content = "Fatura FT-2025/001\nData: 2025-01-15\nTotal: 123,45 EUR"
+        values = extract_missing_fields(content, {}, ["issue_date", "total_gross", "supplier"])
+        assert values == {"issue_date": "2025-01-15", "total_gross": "123,45"}
+
+    def test_fields_from_the_model_are_kept(self) -> None:
+        content = "Fatura FT-2025/001\nTotal: 123,45 EUR"
+        fields = {"invoice_number": "FT-2025/002", "total_gross": None, "nif": "500100200"}
+        values = extract_missing_fields(content, fields, ["invoice_number", "total_gross", "nif"])
+        assert values == {"total_gross": "123,45"}
+
+    def test_subtotal_is_not_the_total(self) -> None:
+        content = "Subtotal: 10,00\nIVA 23%: 2,30\nTotal: 12,30"
+        assert extract_missing_fields(content, {}, ["total_gross"]) == {"total_gross": "12,30"}
+
+    def test_issue_date_needs_a_label(self) -> None:
+        content = "Período 2025-01-01 a 2025-01-31\nData de vencimento: 2025-02-20"
+        assert extract_missing_fields(content, {}, ["issue_date"]) == {}
+
+        content += "\nData de emissão: 2025-02-01"
+        assert extract_missing_fields(content, {}, ["issue_date"]) == {"issue_date": "2025-02-01"}
+
+    def test_no_matches(self) -> None:
+        assert extract_missing_fields("nothing useful", {}, ["total_gross"]) == {}
@@ -0,0 +1,274 @@
+"""Tests for document type processors."""
+
+import pytest
+
+from papersqueeze.config.schema import Template
+from papersqueeze.models.document import Document
+from papersqueeze.models.extraction import (
+    ExtractedField,
+    ExtractionResult,
+    FieldType,
+    ProcessingResult,
+    ProposedChange,
+)
+from papersqueeze.processors import PROCESSOR_REGISTRY
+from papersqueeze.processors.base import BaseProcessor
+from papersqueeze.processors.fines import FinesProcessor
+from papersqueeze.processors.general import GeneralProcessor
+from papersqueeze.processors.tax import TaxProcessor
+from papersqueeze.processors.utilities import UtilitiesEnergyProcessor
+
+
+class TestFinesProcessor:
+    """Tests for fines post-processing."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("Veículo matrícula AA-12-BB autuado", "AA-12-BB"),
+            ("matrícula 12 ab 34, excesso de velocidade", "12-AB-34"),
+            ("matrícula AB1234", "AB-12-34"),
+            ("matrícula AA-12\u00a0BB", "AA-12-BB"),
+            ("Sem matrícula: 12345", None),
+            # An earlier format in the priority list wins over an earlier match
+            ("Auto 12-AB-34, matrícula AA-12-BB", "AA-12-BB"),
+        ],
+    )
+    def test_extract_plate(self, content: str, expected: str | None) -> None:
+        assert FinesProcessor()._extract_plate(content) == expected
+
+    def test_post_process_refreshes_confidence_summary(self) -> None:
+        extraction = ExtractionResult(
+            template_id="law_enforcement_fines",
+            template_confidence=1.0,
+            fields={
+                "issue_date": ExtractedField(
+                    name="issue_date",
+                    raw_value="2024-03-01",
+                    normalized_value="2024-03-01",
+                    confidence=0.5,
+                    field_type=FieldType.DATE,
+                ),
+            },
+        )
+        assert extraction.extracted_count == 1
+
+        FinesProcessor().post_process(extraction, Document(id=1, title="Multa"))
+
+        assert extraction.extracted_count == 2
+        assert list(extraction.confident_fields) == ["due_date"]
+        assert extraction.overall_confidence == pytest.approx((1.0 + 0.7) / 2)
+
+
+class TestTaxProcessor:
+    """Tests for tax type detection."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("Pagamento de IVA referente à DMR de março", "DMR"),
+            ("IMPOSTO ÚNICO DE CIRCULAÇÃO 2024", "IUC"),
+            ("Liquidação do Imposto Municipal sobre Imóveis", "IMI"),
+            ("Nota de liquidação", None),
+        ],
+    )
+    def test_detect_tax_type(self, content: str, expected: str | None) -> None:
+        assert TaxProcessor()._detect_tax_type(content) == expected
+
+
+class TestNormalizeField:
+    """Tests for type-based field normalization."""
+
+    @pytest.mark.parametrize(
+        ("field_type", "raw", "expected"),
+        [
+            (FieldType.INTEGER, "1.234,00 kWh", "1234"),
+            (FieldType.INTEGER, "n/a", None),
+            (FieldType.STRING, "  EDP   Comercial ", "EDP Comercial"),
+        ],
+    )
+    def test_normalize_field(self, field_type: FieldType, raw: str, expected: str | None) -> None:
+        field = ExtractedField(name="x", raw_value=raw, field_type=field_type)
+
+        assert GeneralProcessor().normalize_field(field).normalized_value == expected
+
+
+class TestValidateExtraction:
+    """Tests for required-field validation."""
+
+    def test_reports_missing_and_low_confidence_fields(self) -> None:
+        template = Template.model_validate(
+            {
+                "id": "t",
+                "description": "T",
+                "extraction": {
+                    "rules": "",
+                    "fields": [
+                        {"name": "total", "required": True},
+                        {"name": "nif", "required": True},
+                        {"name": "notes"},
+                    ],
+                },
+            }
+        )
+        extraction = ExtractionResult(
+            template_id="t",
+            template_confidence=1.0,
+            fields={"nif": ExtractedField(name="nif", raw_value="123", confidence=0.3)},
+        )
+
+        assert template.required_field_names == ("total", "nif")
+        assert GeneralProcessor().validate_extraction(extraction, template) == [
+            "Required field 'total' is missing",
+            "Required field 'nif' has low confidence (0.30)",
+        ]
+
+
+class TestProcessingResult:
+    """Tests for the review decision."""
+
+    @pytest.mark.parametrize(
+        ("current", "proposed", "confidence", "expected"),
+        [
+            (None, "x", 0.1, False),  # fill
+            ("", "x", 0.1, False),  # fill
+            ("x", "x", 0.1, False),  # unchanged
+            ("x", "y", 0.95, False),  # confident change
+            ("x", "y", 0.5, True),  # uncertain change
+        ],
+    )
+    def test_needs_review(
+        self, current: str | None, proposed: str, confidence: float, expected: bool
+    ) -> None:
+        change = ProposedChange("title", current, proposed, confidence)
+        result = ProcessingResult(doc_id=1, success=True, proposed_changes=[change])
+
+        assert result.needs_review is expected
+        assert result.needs_review is (change.is_change and confidence < 0.9)
+
+
+class TestExtractionResult:
+    """Tests for extraction serialization."""
+
+    def test_to_dict(self) -> None:
+        extraction = ExtractionResult(
+            template_id="t",
+            template_confidence=0.8,
+            fields={
+                "total": ExtractedField(
+                    name="total",
+                    raw_value="12,30 €",
+                    normalized_value="12.30",
+                    confidence=0.8,
+                    field_type=FieldType.AMOUNT,
+                ),
+            },
+        )
+
+        assert extraction.to_dict() == {
+            "template_id": "t",
+            "template_confidence": 0.8,
+            "overall_confidence": 0.8,
+            "fields": {
+                "total": {
+                    "raw_value": "12,30 €",
+                    "normalized_value": "12.30",
+                    "confidence": 0.8,
+                    "type": "amount",
+                },
+            },
+            "processing_time_ms": 0.0,
+        }
+
+
+class TestNormalizeExtraction:
+    """Tests for whole-extraction normalization."""
+
+    def make_extraction(self) -> ExtractionResult:
+        return ExtractionResult(
+            template_id="t",
+            template_confidence=1.0,
+            fields={
+                "issue_date": ExtractedField("issue_date", "15/01/2025", field_type=FieldType.DATE),
+                "total": ExtractedField("total", "1.234,56 €", field_type=FieldType.AMOUNT),
+                "kwh": ExtractedField("kwh", "150 kWh", field_type=FieldType.INTEGER),
+                "missing": ExtractedField("missing", None, field_type=FieldType.DATE),
+            },
+        )
+
+    def test_matches_per_field_normalization(self) -> None:
+        processor = GeneralProcessor()
+        normalized = processor.normalize_extraction(self.make_extraction())
+        expected = self.make_extraction()
+        for field in expected.fields.values():
+            processor.normalize_field(field)
+
+        assert normalized == expected
+        assert normalized.fields["missing"].normalized_value is None
+
+    def test_overridden_normalize_field_is_used(self) -> None:
+        class UpperProcessor(GeneralProcessor):
+            def normalize_field(self, field: ExtractedField) -> ExtractedField:
+                field.normalized_value = (field.raw_value or "").upper()
+                return field
+
+        extraction = UpperProcessor().normalize_extraction(self.make_extraction())
+
+        assert extraction.fields["kwh"].normalized_value == "150 KWH"
+
+
+class TestFormatTitle:
+    """Tests for title formatting."""
+
+    def test_uses_best_values_and_document_date(self) -> None:
+        template = Template(id="t", description="T", title_format="{issue_date} | {ref} | {total}")
+        extraction = ExtractionResult(
+            template_id="t",
+            template_confidence=1.0,
+            fields={
+                "ref": ExtractedField("ref", "FT 1/2", normalized_value=""),
+                "total": ExtractedField("total", "12,30", normalized_value="12.30"),
+            },
+        )
+        document = Document(id=1, title="Doc", created="2025-01-15")
+
+        title = GeneralProcessor().format_title(template, extraction, document)
+
+        assert title == "2025-01-15 | FT 1/2 | 12.30"
+
+
+class TestUtilitiesProcessors:
+    """Tests for utility invoice post-processing."""
+
+    @pytest.mark.parametrize(
+        ("normalized", "expected"),
+        [("150", "150"), ("1.234", "1.234"), ("150 kWh", "150"), ("12.50", "12.5")],
+    )
+    def test_consumption_is_plain_number(self, normalized: str, expected: str) -> None:
+        extraction = ExtractionResult(
+            template_id="utilities_energy",
+            template_confidence=1.0,
+            fields={
+                "consumption_kwh": ExtractedField(
+                    "consumption_kwh", normalized, normalized_value=normalized
+                ),
+            },
+        )
+
+        UtilitiesEnergyProcessor().post_process(extraction, Document(id=1, title="Fatura"))
+
+        assert extraction.fields["consumption_kwh"].normalized_value == expected
+
+
+def test_registry_maps_template_ids_to_processors() -> None:
+    assert PROCESSOR_REGISTRY["law_enforcement_fines"] is FinesProcessor
+    assert all(cls.template_id == tid for tid, cls in PROCESSOR_REGISTRY.items())
+    with pytest.raises(TypeError):
+        PROCESSOR_REGISTRY["new"] = GeneralProcessor  # type: ignore[index]
+
+
+def test_processor_must_define_template_id() -> None:
+    with pytest.raises(TypeError, match="must define template_id"):
+
+        class IncompleteProcessor(BaseProcessor):
+            description = "No template"
@@ -0,0 +1,106 @@
+"""Tests for configuration schema helpers."""
+
+import sys
+
+from papersqueeze.config.schema import FieldMappingConfig, Template, TemplatesConfig
+
+
+class TestFieldMappingConfig:
+    """Tests for semantic field mapping."""
+
+    def test_get_paperless_field(self) -> None:
+        mapping = FieldMappingConfig(total_gross="amount", nif=None)
+
+        assert mapping.get_paperless_field("total_gross") == "amount"
+        assert mapping.get_paperless_field("nif") is None
+        assert mapping.get_paperless_field("unknown") is None
+
+    def test_non_field_attributes_are_not_mappings(self) -> None:
+        assert FieldMappingConfig().get_paperless_field("model_dump") is None
+
+    def test_to_dict_returns_copy(self) -> None:
+        mapping = FieldMappingConfig()
+        mapping.to_dict()["total_gross"] = "changed"
+
+        assert mapping.get_paperless_field("total_gross") == "amt_primary"
+
+    def test_field_names_are_interned(self) -> None:
+        name = "".join(["amo", "unt"])  # built at runtime, so not interned
+        mapping = FieldMappingConfig(total_gross=name)
+        template = Template(id="t", description="T", field_mapping={"total": name})
+
+        assert mapping.get_paperless_field("total_gross") is sys.intern("amount")
+        assert template.field_mapping["total"] is sys.intern("amount")
+
+    def test_template_field_names_are_interned(self) -> None:
+        name = "".join(["issue", "_date"])
+        template = Template.model_validate(
+            {"id": "t", "description": "T", "extraction": {"rules": "", "fields": [{"name": name}]}}
+        )
+
+        assert template.extraction is not None
+        assert template.extraction.fields[0].name is sys.intern("issue_date")
+
+
+class TestTemplatesConfig:
+    """Tests for template lookups."""
+
+    def make_config(self) -> TemplatesConfig:
+        return TemplatesConfig(
+            templates=[
+                Template(
+                    id="energy", description="d", correspondent_ids=[3], correspondent_hint="EDP"
+                ),
+                Template(
+                    id="water", description="d", correspondent_ids=[3, 4], correspondent_hint="Águas"
+                ),
+                Template(id="energy", description="duplicate"),
+            ]
+        )
+
+    def test_get_template_by_id(self) -> None:
+        config = self.make_config()
+
+        assert config.get_template_by_id("energy").description == "d"
+        assert config.get_template_by_id("missing") is None
+        assert config.get_template_ids() == ["energy", "water", "energy"]
+
+    def test_find_by_correspondent_id(self) -> None:
+        config = self.make_config()
+
+        assert config.find_template_for_correspondent(3, None).id == "energy"
+        assert config.find_template_for_correspondent(4, None).id == "water"
+
+    def test_find_by_correspondent_hint(self) -> None:
+        config = self.make_config()
+
+        assert config.find_template_for_correspondent(99, "EDP Comercial").id == "energy"
+        assert config.find_template_for_correspondent(None, "ÁGUAS do Porto").id == "water"
+        assert config.find_template_for_correspondent(None, "Other") is None
+
+
+class TestTemplateFieldNames:
+    """Tests for the precomputed extraction field names."""
+
+    def test_field_names(self) -> None:
+        template = Template.model_validate(
+            {
+                "id": "t",
+                "description": "T",
+                "extraction": {
+                    "rules": "",
+                    "fields": [{"name": "issue_date", "required": True}, {"name": "notes"}],
+                },
+            }
+        )
+
+        assert template.field_names == ("issue_date", "notes")
+        assert template.required_field_names == ("issue_date",)
+        assert template.field_index == {"issue_date": True, "notes": False}
+
+    def test_no_extraction(self) -> None:
+        template = Template(id="t", description="T")
+
+        assert template.field_names == ()
+        assert template.required_field_names == ()
+        assert template.field_index == {}